@@ -1,8 +1,52 @@
 import streamlit as st
+import abc
+import argparse
+import bisect
+import atexit
+import contextlib
+import contextvars
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import logging
+import mmap
 import os
-import pandas as pd
+import queue
+import re
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from typing import TYPE_CHECKING, BinaryIO
+from urllib.parse import quote
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not locked across processes
+    fcntl = None
+
+if TYPE_CHECKING:
+    # Imported lazily by the analytics and trends views; see load_feedback_stats
+    import pandas as pd
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Without watchdog the catalog is refreshed on every run
+    FileSystemEventHandler, Observer = object, None
 
 
 
@@ -14,132 +58,3243 @@ from datetime import datetime
 # Each JSON file contains the page title, subtitle, period, a list of top developments,
 # and regional overviews. JSON files should be named according to the week
 # (e.g., `week 44.json`) and reside inside a folder (e.g., `Week 44`) alongside
-# their corresponding audio files. The most recently modified JSON determines the
+# their corresponding audio files. The newest edition (by year and week number, as
+# recorded in the edition catalog `content_versions/.cache/catalog.json`) determines the
 # landing page; previous versions are selectable via the sidebar.
 #
+# Before rendering, each edition is validated and precompiled into a hidden render
+# artifact next to its JSON (e.g. `.week 44.render.json`). Artifacts are rebuilt
+# automatically when the edition catalog changes, or in bulk with
+# `python app.py build`. With watchdog installed, new or edited editions are
+# picked up from filesystem events while the app runs.
+#
 # Audio files must be present in the same folder as their JSON file with fixed names:
 # - "Executive Summary.m4a"
 # - "Deep Dive.m4a"
+# Their duration, size and bitrate are cached in a hidden `.audio.json` sidecar
+# per week folder (`python app.py index-audio` reports missing or corrupt audio).
 #
 # Feedback from users is stored in a CSV file (`feedback.csv`) within each week's folder.
 # Each entry records the newsletter item, rating, comment, and timestamp. Feedback is
 # separated per week and can be downloaded as a CSV file.
 
 
-# Determine base directory of this script so relative paths resolve correctly even
-# when the working directory changes (e.g., when running on Streamlit Cloud).
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CONTENT_DIR = os.path.join(BASE_DIR, "content_versions")
+_LOGGER = logging.getLogger("newsletter")
+
+# Determine base directory of this script so relative paths resolve correctly even
+# when the working directory changes (e.g., when running on Streamlit Cloud).
+# NEWSLETTER_CONTENT_DIR points the app at another content tree (e.g. benchmarks).
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.abspath(
+    os.environ.get("NEWSLETTER_CONTENT_DIR", os.path.join(BASE_DIR, "content_versions"))
+)
+
+
+# Files generated by the app (catalog, caches) live in a hidden subdirectory so
+# writing them never changes the mtime of `content_versions` itself.
+CACHE_DIR = os.path.join(CONTENT_DIR, ".cache")
+CATALOG_PATH = os.path.join(CACHE_DIR, "catalog.json")
+CATALOG_VERSION = 2
+
+# Fallback patterns for editions whose JSON lacks `week_number`/`year_number`,
+# e.g. "Week 44" folders, "Week 46 Y25.json" files or a `period` such as
+# "24 October 2025 to 3 November 2025".
+_WEEK_PATTERN = re.compile(r"week\s*(\d{1,2})", re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r"\bY(\d{2}|\d{4})\b")
+_PERIOD_YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+def _write_json_atomic(path: str, data, **dump_kwargs):
+    """
+    Write `data` as JSON to a temporary file and rename it over `path`, so
+    readers never see a partial file. Creates missing parent directories.
+    Raises OSError after removing the temporary file; callers whose data can
+    live in memory on a read-only volume suppress it.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _is_edition_json(name: str) -> bool:
+    """
+    Return True for newsletter JSON files. Dot-prefixed JSON files are
+    generated by the app and are never editions.
+    """
+    return name.lower().endswith(".json") and not name.startswith(".")
+
+
+def _read_edition_metadata(json_path: str) -> dict:
+    """
+    Read the title, week and year of an edition. Missing week/year numbers are
+    derived from the file and folder names; a missing year also from the last
+    year mentioned in the edition's `period`. Editions without any year keep
+    year_number None and are listed after those with one.
+    """
+    title, week_number, year_number, period = None, None, None, None
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            title = data.get("title")
+            week_number = data.get("week_number")
+            year_number = data.get("year_number")
+            period = data.get("period")
+    except (OSError, ValueError):
+        # Unreadable editions are still listed; load_content reports the error
+        pass
+
+    names = f"{os.path.basename(os.path.dirname(json_path))} {os.path.basename(json_path)}"
+    if not isinstance(week_number, int):
+        match = _WEEK_PATTERN.search(names)
+        week_number = int(match.group(1)) if match else None
+    if not isinstance(year_number, int):
+        match = _YEAR_PATTERN.search(names)
+        if match:
+            year_number = int(match.group(1))
+            if year_number < 100:
+                year_number += 2000
+        else:
+            years = _PERIOD_YEAR_PATTERN.findall(period) if isinstance(period, str) else []
+            year_number = int(years[-1]) if years else None
+    return {
+        "title": title,
+        "week_number": week_number,
+        "year_number": year_number,
+    }
+
+
+class EditionCatalog:
+    """
+    Persistent manifest of the editions in `content_versions`.
+
+    The manifest (`.cache/catalog.json`) stores the path, title, week_number,
+    year_number and mtime of every edition JSON together with the mtime of
+    every directory that was scanned. A refresh stats directories and known
+    edition files; a directory is listed again only when its mtime changed (a
+    file was added, removed or renamed in it), and an edition is parsed again
+    only when its mtime or size changed, which also catches editions
+    overwritten in place.
+    """
+
+    def __init__(self, content_dir: str, manifest_path: str):
+        self.content_dir = content_dir
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        # Relative directory path -> directory mtime_ns at the last listing
+        self._dirs: dict[str, int] = {}
+        # Relative JSON path -> edition entry
+        self._editions: dict[str, dict] = {}
+        # Incremented whenever an edition is added, removed or changed
+        self.generation = 0
+        self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(manifest, dict) or manifest.get("version") != CATALOG_VERSION:
+            return
+        self._dirs = dict(manifest.get("dirs", {}))
+        self._editions = dict(manifest.get("editions", {}))
+
+    def _save_manifest(self):
+        manifest = {
+            "version": CATALOG_VERSION,
+            "dirs": self._dirs,
+            "editions": self._editions,
+        }
+        # The catalog still works in memory on a read-only volume
+        with contextlib.suppress(OSError):
+            _write_json_atomic(self.manifest_path, manifest, indent=1)
+
+    def _forget_dir(self, rel_dir: str):
+        """Drop a directory, its subdirectories and their editions from the catalog."""
+        prefix = rel_dir + os.sep
+        for key in [d for d in self._dirs if d == rel_dir or d.startswith(prefix)]:
+            del self._dirs[key]
+        for key in [p for p in self._editions if p.startswith(prefix)]:
+            del self._editions[key]
+
+    def _update_edition(self, rel_path: str, stat: os.stat_result) -> bool:
+        """Re-read an edition's metadata if its mtime or size changed. Returns True if it did."""
+        known = self._editions.get(rel_path)
+        if known and known["mtime"] == stat.st_mtime and known["size"] == stat.st_size:
+            return False
+        self._editions[rel_path] = {
+            "path": rel_path,
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            **_read_edition_metadata(os.path.join(self.content_dir, rel_path)),
+        }
+        return True
+
+    def _scan_dir(
+        self, rel_dir: str, children: dict[str, list[str]], files: dict[str, list[str]],
+    ) -> tuple[bool, bool]:
+        """
+        Rescan a directory if its mtime changed, or else stat its known
+        editions, then recurse into its subdirectories. Returns (editions
+        changed, directories changed).
+        """
+        abs_dir = os.path.join(self.content_dir, rel_dir) if rel_dir else self.content_dir
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            self._forget_dir(rel_dir)
+            return True, True
+
+        changed, dirs_changed = False, False
+        if self._dirs.get(rel_dir) == dir_mtime:
+            subdirs = children.get(rel_dir, [])
+            # Overwriting a file in place does not change the directory's mtime
+            for rel_path in files.get(rel_dir, []):
+                try:
+                    stat = os.stat(os.path.join(self.content_dir, rel_path))
+                except OSError:
+                    changed = True
+                    del self._editions[rel_path]
+                    continue
+                changed = self._update_edition(rel_path, stat) or changed
+        else:
+            dirs_changed = True
+            self._dirs[rel_dir] = dir_mtime
+            subdirs, seen = [], set()
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    if entry.is_dir():
+                        # Hidden directories hold generated files, not editions
+                        if not entry.name.startswith("."):
+                            subdirs.append(rel_path)
+                    elif _is_edition_json(entry.name):
+                        seen.add(rel_path)
+                        changed = self._update_edition(rel_path, entry.stat()) or changed
+            # Drop editions and subdirectories that disappeared from this directory
+            for rel_path in [p for p in self._editions if os.path.dirname(p) == rel_dir and p not in seen]:
+                changed = True
+                del self._editions[rel_path]
+            for old_dir in children.get(rel_dir, []):
+                if old_dir not in subdirs:
+                    changed = True
+                    self._forget_dir(old_dir)
+        for sub in subdirs:
+            sub_changed, sub_dirs_changed = self._scan_dir(sub, children, files)
+            changed = changed or sub_changed
+            dirs_changed = dirs_changed or sub_dirs_changed
+        return changed, dirs_changed
+
+    def mark_dirty(self, abs_dir: str):
+        """
+        List the directory at `abs_dir` again on the next refresh even if its
+        mtime did not change, e.g. when an edition was overwritten in place.
+        Unknown directories mark their nearest known parent instead.
+        """
+        rel_dir = os.path.relpath(abs_dir, self.content_dir)
+        if rel_dir == os.curdir:
+            rel_dir = ""
+        if rel_dir.startswith(os.pardir):
+            return
+        with self._lock:
+            while rel_dir not in self._dirs and rel_dir:
+                rel_dir = os.path.dirname(rel_dir)
+            if rel_dir in self._dirs:
+                self._dirs[rel_dir] = -1
+
+    def refresh(self) -> bool:
+        """
+        Bring the catalog up to date with the content directory. Returns True
+        when any edition was added, removed or changed.
+        """
+        with self._lock:
+            if not os.path.isdir(self.content_dir):
+                os.makedirs(self.content_dir, exist_ok=True)
+            children: dict[str, list[str]] = {}
+            for rel_dir in self._dirs:
+                if rel_dir:
+                    children.setdefault(os.path.dirname(rel_dir), []).append(rel_dir)
+            files: dict[str, list[str]] = {}
+            for rel_path in self._editions:
+                files.setdefault(os.path.dirname(rel_path), []).append(rel_path)
+            changed, dirs_changed = self._scan_dir("", children, files)
+            if changed:
+                self.generation += 1
+            if changed or dirs_changed:
+                self._save_manifest()
+            return changed
+
+    def changes(self, known: Mapping[str, Mapping]) -> tuple[dict[str, dict], list[str], list[str]]:
+        """
+        Compare per-edition state derived from the catalog, keyed by relative
+        edition path and holding the "mtime" and "size" it was derived from.
+        Returns the catalog entries (with absolute paths) keyed by relative
+        path, the removed paths, and the new or changed paths.
+        """
+        entries = {
+            os.path.relpath(entry["path"], self.content_dir): entry
+            for entry in self.editions()
+        }
+        removed = [rel_path for rel_path in known if rel_path not in entries]
+        changed = [
+            rel_path for rel_path, entry in entries.items()
+            if rel_path not in known
+            or known[rel_path].get("mtime") != entry["mtime"]
+            or known[rel_path].get("size") != entry["size"]
+        ]
+        return entries, removed, changed
+
+    def editions(self) -> list[dict]:
+        """
+        Return catalog entries with absolute paths, newest edition first
+        (sorted by year_number, then week_number, then mtime). Editions
+        without a year_number come after all editions with one.
+        """
+        with self._lock:
+            entries = [
+                {**entry, "path": os.path.join(self.content_dir, entry["path"])}
+                for entry in self._editions.values()
+            ]
+        entries.sort(
+            key=lambda e: (
+                e["year_number"] is not None, e["year_number"] or 0, e["week_number"] or 0, e["mtime"],
+            ),
+            reverse=True,
+        )
+        return entries
+
+
+@st.cache_resource
+def get_edition_catalog() -> EditionCatalog:
+    """
+    Return the process-wide edition catalog, shared by all sessions.
+    """
+    return EditionCatalog(CONTENT_DIR, CATALOG_PATH)
+
+
+# Per-rerun stage timings. Collected for every run when NEWSLETTER_TIMINGS=1,
+# and for runs opened with `?debug=1`, which also shows them in a sidebar debug
+# panel. Collected runs are written to the "newsletter.timings" log as JSON
+# lines. When
+# NEWSLETTER_METRICS_PORT is set, p50/p95 per stage and cache/writer metrics are
+# served as JSON on http://<host>:<port>/metrics. With timings off, each span
+# costs one context variable lookup.
+TIMINGS_ENABLED = os.environ.get("NEWSLETTER_TIMINGS", "") == "1"
+METRICS_PORT = int(os.environ.get("NEWSLETTER_METRICS_PORT", "0") or 0)
+# Number of recent samples per stage used for the percentiles
+TIMING_WINDOW = 1000
+
+_TIMINGS_LOGGER = logging.getLogger("newsletter.timings")
+
+
+class RunTimings:
+    """
+    Timings of one script run: consecutive `stages` of main() (see `lap`) and
+    `spans` around helper functions, which may overlap the stages.
+    """
+
+    __slots__ = ("started", "stages", "spans", "_last")
+
+    def __init__(self):
+        self.started = self._last = time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+        self.spans: list[tuple[str, float]] = []
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        return self._last - self.started
+
+
+class _Span:
+    __slots__ = ("run", "name", "started")
+
+    def __init__(self, run: RunTimings, name: str):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.run.spans.append((self.name, time.perf_counter() - self.started))
+
+
+_NO_SPAN = contextlib.nullcontext()
+_RUN_TIMINGS: contextvars.ContextVar[RunTimings | None] = contextvars.ContextVar(
+    "run_timings", default=None
+)
+
+
+def timed(name: str):
+    """Context manager timing a helper function call within the current run."""
+    run = _RUN_TIMINGS.get()
+    return _NO_SPAN if run is None else _Span(run, name)
+
+
+def lap(stage: str):
+    """Close the current stage of main(), timed since the previous lap."""
+    run = _RUN_TIMINGS.get()
+    if run is not None:
+        run.lap(stage)
+
+
+class StageTimings:
+    """
+    Process-wide rolling window of stage and span durations, shared by all
+    sessions, with p50/p95 summaries.
+    """
+
+    def __init__(self, window: int = TIMING_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque] = {}
+
+    def record(self, timings: list[tuple[str, float]]):
+        with self._lock:
+            for name, seconds in timings:
+                samples = self._samples.get(name)
+                if samples is None:
+                    samples = self._samples[name] = deque(maxlen=self.window)
+                samples.append(seconds)
+
+    def summary(self) -> dict[str, dict]:
+        """Return count, p50 and p95 (in milliseconds) per stage."""
+        with self._lock:
+            snapshot = {name: sorted(samples) for name, samples in self._samples.items()}
+        return {
+            name: {
+                "count": len(samples),
+                "p50_ms": samples[len(samples) // 2] * 1000,
+                "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+            }
+            for name, samples in snapshot.items()
+        }
+
+
+@st.cache_resource
+def get_stage_timings() -> StageTimings:
+    """
+    Return the process-wide stage timings. Enables the JSON timing log the
+    first time timings are collected.
+    """
+    if not _TIMINGS_LOGGER.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _TIMINGS_LOGGER.addHandler(handler)
+        _TIMINGS_LOGGER.setLevel(logging.INFO)
+        _TIMINGS_LOGGER.propagate = False
+    return StageTimings()
+
+
+def _metrics_snapshot(
+    stage_timings: StageTimings, content_cache: "ContentCache",
+    artifact_cache: "ContentCache", feedback_writer: "FeedbackWriter",
+) -> dict:
+    return {
+        "stages": stage_timings.summary(),
+        "content_cache": content_cache.stats(),
+        "artifact_cache": artifact_cache.stats(),
+        "feedback_writer": feedback_writer.metrics(),
+    }
+
+
+def _metrics_sources() -> tuple:
+    return get_stage_timings(), get_content_cache(), get_artifact_cache(), get_feedback_writer()
+
+
+def collect_metrics() -> dict:
+    """Return stage percentiles and cache/writer metrics of this process."""
+    return _metrics_snapshot(*_metrics_sources())
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = json.dumps(_metrics_snapshot(*self.server.metrics_sources)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are frequent; keep them out of the app's log
+        pass
+
+
+@st.cache_resource
+def start_metrics_server(port: int) -> ThreadingHTTPServer | None:
+    """
+    Serve collect_metrics() as JSON on `port` from a daemon thread, once per
+    process. Returns None if the port is unavailable (e.g. another worker).
+    """
+    try:
+        server = ThreadingHTTPServer(("", port), _MetricsHandler)
+    except OSError as e:
+        _LOGGER.warning("Metrics endpoint not started on port %d: %s", port, e)
+        return None
+    # Resolve the shared objects here: the server thread has no script run context
+    server.metrics_sources = _metrics_sources()
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+
+def report_run_timings(run: RunTimings, edition: str | None, show_panel: bool):
+    """
+    Record a finished run's timings in the process-wide window, write them to
+    the timing log and, if requested, render the sidebar debug panel.
+    """
+    # A helper called several times in a run (e.g. once per audio file) is
+    # reported as the sum of its spans
+    spans: dict[str, float] = {}
+    for name, seconds in run.spans:
+        spans[name] = spans.get(name, 0.0) + seconds
+    stage_timings = get_stage_timings()
+    stage_timings.record([*run.stages, ("total", run.total()), *spans.items()])
+    _TIMINGS_LOGGER.info(json.dumps({
+        "event": "run_timings",
+        "edition": edition,
+        "total_ms": round(run.total() * 1000, 3),
+        "stages": {name: round(seconds * 1000, 3) for name, seconds in run.stages},
+        "spans": {name: round(seconds * 1000, 3) for name, seconds in spans.items()},
+    }))
+    if not show_panel:
+        return
+
+    summary = stage_timings.summary()
+    lines = ["| Stage | This run | p50 | p95 |", "|---|---:|---:|---:|"]
+    for name, seconds in [*run.stages, ("total", run.total()), *spans.items()]:
+        stats = summary.get(name, {})
+        lines.append(
+            f"| {name} | {seconds * 1000:.1f} ms | {stats.get('p50_ms', 0):.1f} ms"
+            f" | {stats.get('p95_ms', 0):.1f} ms |"
+        )
+    with st.sidebar.expander("⏱️ Debug: timings", expanded=True):
+        st.markdown("\n".join(lines))
+        st.caption("Stages add up to the total; helper spans overlap them.")
+        st.json(collect_metrics(), expanded=False)
+
+
+def refresh_catalog(catalog: EditionCatalog) -> bool:
+    """
+    Refresh the edition catalog and precompile new or changed editions.
+    Returns True when any edition was added, removed or changed.
+    """
+    changed = catalog.refresh()
+    if changed:
+        # Unchanged editions are skipped by build_edition
+        for entry in catalog.editions():
+            build_edition(entry["path"])
+    return changed
+
+
+def get_available_versions() -> list[str]:
+    """
+    Return absolute paths to the edition JSON files in `content_versions`,
+    newest edition first. The list comes from the edition catalog, which is
+    kept up to date by the content watcher; without a watcher it is refreshed
+    here, rescanning only directories and editions whose mtime changed since
+    the last call.
+    """
+    with timed("get_available_versions"):
+        catalog = get_edition_catalog()
+        watcher = get_content_watcher()
+        if watcher is None or not watcher.is_alive():
+            refresh_catalog(catalog)
+        return [entry["path"] for entry in catalog.editions()]
+
+
+# One segment file per edition, so re-indexing an edition rewrites only its segment
+SEARCH_INDEX_DIR = os.path.join(CACHE_DIR, "search_index")
+SEARCH_INDEX_VERSION = 2
+# Number of search results shown in the sidebar
+SEARCH_RESULT_LIMIT = 10
+# The last query term matches as a prefix once it has this many characters,
+# expanding to at most this many vocabulary tokens, which bounds the cost of
+# short prefixes that match a large part of the vocabulary
+SEARCH_MIN_PREFIX = 2
+SEARCH_PREFIX_EXPANSIONS = 32
+# Weight of a query term found in an item's title, tags or description
+_SEARCH_FIELD_WEIGHTS = {"title": 3, "tags": 2, "description": 1}
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def edition_label(json_path: str) -> str:
+    """Display name of an edition: its file name without extension (e.g. 'Week 44 Y25')."""
+    return os.path.splitext(os.path.basename(json_path))[0]
+
+
+class SearchIndex:
+    """
+    Persistent inverted index over the title, tags and description of every
+    item in every edition, shared by all sessions.
+
+    Each posting maps a token to the documents (items) containing it and a
+    weight by field. Documents keep the title and a snippet, so searching never
+    reads edition files. `sync` re-indexes only editions whose mtime or size
+    changed since they were indexed and drops removed editions. Each edition's
+    documents and postings are persisted as a separate segment in `index_dir`,
+    so a changed edition costs one small write and segments are merged in
+    memory on load.
+    """
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        self._lock = threading.Lock()
+        # Relative edition path -> {"mtime", "size", "docs": [doc ids], "tokens": [tokens]}
+        self._editions: dict[str, dict] = {}
+        # Doc id -> {"edition", "label", "section", "idx", "title", "snippet"}
+        self._docs: dict[str, dict] = {}
+        # Token -> {doc id: weight}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._vocabulary: list[str] = []
+        self._synced_generation = -1
+        self._load()
+
+    def _segment_path(self, rel_path: str) -> str:
+        return os.path.join(self.index_dir, hashlib.sha1(rel_path.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self):
+        try:
+            names = os.listdir(self.index_dir)
+        except OSError:
+            return
+        for name in names:
+            try:
+                with open(os.path.join(self.index_dir, name), "r", encoding="utf-8") as f:
+                    segment = json.load(f)
+            except (OSError, ValueError):
+                continue
+            # Unreadable or outdated segments are re-indexed on the next sync
+            if not isinstance(segment, dict) or segment.get("version") != SEARCH_INDEX_VERSION:
+                continue
+            self._merge(segment)
+        self._vocabulary = sorted(self._postings)
+
+    def _merge(self, segment: dict):
+        """Add an edition's segment to the in-memory index."""
+        self._docs.update(segment["docs"])
+        for token, docs in segment["postings"].items():
+            known = self._postings.get(token)
+            if known is None:
+                self._postings[token] = dict(docs)
+            else:
+                known.update(docs)
+        self._editions[segment["path"]] = {
+            "mtime": segment["mtime"],
+            "size": segment["size"],
+            "docs": list(segment["docs"]),
+            "tokens": list(segment["postings"]),
+        }
+
+    def _remove_edition(self, rel_path: str):
+        edition = self._editions.pop(rel_path, None)
+        if edition is None:
+            return
+        for token in edition["tokens"]:
+            docs = self._postings.get(token, {})
+            for doc_id in edition["docs"]:
+                docs.pop(doc_id, None)
+            if not docs:
+                self._postings.pop(token, None)
+        for doc_id in edition["docs"]:
+            self._docs.pop(doc_id, None)
+
+    def _add_edition(self, rel_path: str, abs_path: str, entry: dict) -> dict:
+        """Index an edition and return its segment."""
+        try:
+            artifact = compile_edition(abs_path)
+        except (OSError, ValueError):
+            # Invalid editions are not searchable; the page shows their error
+            artifact = {"top_developments": [], "regional_overviews": []}
+        docs: dict[str, dict] = {}
+        postings: dict[str, dict[str, int]] = {}
+        for section in ("top_developments", "regional_overviews"):
+            for idx, item in enumerate(artifact[section]):
+                doc_id = f"{rel_path}#{section}#{idx}"
+                description = item["description"]
+                docs[doc_id] = {
+                    "edition": rel_path,
+                    "label": edition_label(abs_path),
+                    "section": section,
+                    "idx": idx,
+                    "title": item["title"],
+                    "snippet": description[:160] + ("…" if len(description) > 160 else ""),
+                }
+                fields = {
+                    "title": item["title"],
+                    "tags": " ".join(item["tags"]),
+                    "description": description,
+                }
+                for field, text in fields.items():
+                    for token in set(_tokenize(text)):
+                        weights = postings.setdefault(token, {})
+                        weights[doc_id] = weights.get(doc_id, 0) + _SEARCH_FIELD_WEIGHTS[field]
+        segment = {
+            "version": SEARCH_INDEX_VERSION,
+            "path": rel_path,
+            "mtime": entry["mtime"],
+            "size": entry["size"],
+            "docs": docs,
+            "postings": postings,
+        }
+        self._merge(segment)
+        return segment
+
+    def sync(self, catalog: EditionCatalog):
+        """
+        Bring the index up to date with the edition catalog. Does nothing when
+        the catalog has not changed since the last sync.
+        """
+        with self._lock:
+            if self._synced_generation == catalog.generation:
+                return
+            entries, removed, changed = catalog.changes(self._editions)
+            for rel_path in removed + changed:
+                self._remove_edition(rel_path)
+            # The index still works in memory on a read-only volume
+            for rel_path in removed:
+                with contextlib.suppress(OSError):
+                    os.remove(self._segment_path(rel_path))
+            for rel_path in changed:
+                segment = self._add_edition(rel_path, entries[rel_path]["path"], entries[rel_path])
+                with contextlib.suppress(OSError):
+                    _write_json_atomic(self._segment_path(rel_path), segment, ensure_ascii=False)
+            if removed or changed:
+                self._vocabulary = sorted(self._postings)
+            self._synced_generation = catalog.generation
+
+    def search(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[dict]:
+        """
+        Return the documents matching every term of `query`, best matches first.
+        The last term also matches as a prefix (see SEARCH_MIN_PREFIX), so
+        results update while typing.
+        """
+        terms = _tokenize(query)
+        if not terms:
+            return []
+        with self._lock:
+            scores: dict[str, int] | None = None
+            for position, term in enumerate(terms):
+                matches: dict[str, int] = dict(self._postings.get(term, {}))
+                if position == len(terms) - 1 and len(term) >= SEARCH_MIN_PREFIX:
+                    start = bisect.bisect_right(self._vocabulary, term)
+                    expansions = itertools.takewhile(
+                        lambda t: t.startswith(term), itertools.islice(self._vocabulary, start, None)
+                    )
+                    for token in itertools.islice(expansions, SEARCH_PREFIX_EXPANSIONS):
+                        for doc_id, weight in self._postings[token].items():
+                            matches[doc_id] = max(matches.get(doc_id, 0), weight)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {d: s + matches[d] for d, s in scores.items() if d in matches}
+                if not scores:
+                    return []
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda pair: pair[1])
+            return [{**self._docs[doc_id], "score": score} for doc_id, score in ranked]
+
+
+@st.cache_resource
+def get_search_index() -> SearchIndex:
+    """
+    Return the process-wide search index, shared by all sessions.
+    """
+    return SearchIndex(SEARCH_INDEX_DIR)
+
+
+def search_editions(query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[dict]:
+    """
+    Search items across all editions. Each result has the edition `label`,
+    `section`, item `idx`, `title`, a description `snippet` and a `score`.
+    """
+    with timed("search_editions"):
+        index = get_search_index()
+        index.sync(get_edition_catalog())
+        return index.search(query, limit)
+
+
+def _select_edition(label: str):
+    st.session_state["selected_edition"] = label
+
+
+TAG_ROLLUPS_PATH = os.path.join(CACHE_DIR, "tag_rollups.json")
+TAG_ROLLUPS_VERSION = 2
+
+
+class TagRollups:
+    """
+    Tag frequency rollups across editions, shared by all sessions.
+
+    Per-edition tag counts are persisted in `.cache/tag_rollups.json` and,
+    like the search index, only recomputed for editions whose mtime or size
+    changed. The weekly and yearly tables are then rebuilt from those counts
+    with a single vectorized pivot whenever the catalog changes.
+    """
+
+    def __init__(self, rollups_path: str):
+        self.rollups_path = rollups_path
+        self._lock = threading.Lock()
+        # Relative edition path -> {"mtime", "size", "year", "week", "tags": {tag: count}}
+        self._editions: dict[str, dict] = {}
+        self._synced_generation = -1
+        self._tables: dict[str, "pd.DataFrame"] | None = None
+        try:
+            with open(rollups_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == TAG_ROLLUPS_VERSION:
+                self._editions = data["editions"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _save(self):
+        data = {"version": TAG_ROLLUPS_VERSION, "editions": self._editions}
+        with contextlib.suppress(OSError):
+            _write_json_atomic(self.rollups_path, data, ensure_ascii=False)
+
+    def sync(self, catalog: EditionCatalog):
+        """Update per-edition tag counts for new, changed and removed editions."""
+        with self._lock:
+            if self._synced_generation == catalog.generation:
+                return
+            entries, removed, changed = catalog.changes(self._editions)
+            for rel_path in removed:
+                del self._editions[rel_path]
+            for rel_path in changed:
+                entry = entries[rel_path]
+                counts: dict[str, int] = {}
+                with contextlib.suppress(OSError, ValueError):
+                    artifact = compile_edition(entry["path"])
+                    for item in (*artifact["top_developments"], *artifact["regional_overviews"]):
+                        for tag in item["tags"]:
+                            counts[tag] = counts.get(tag, 0) + 1
+                self._editions[rel_path] = {
+                    "mtime": entry["mtime"],
+                    "size": entry["size"],
+                    "year": entry["year_number"] or 0,
+                    "week": entry["week_number"] or 0,
+                    "tags": counts,
+                }
+            if removed or changed:
+                self._tables = None
+                self._save()
+            self._synced_generation = catalog.generation
+
+    def tables(self) -> dict[str, "pd.DataFrame"]:
+        """
+        Return the rollup tables: "weekly" (rows: (year, week), columns: tags)
+        and "yearly" (rows: year, columns: tags), both holding item counts.
+        """
+        import pandas as pd
+        with self._lock:
+            if self._tables is None:
+                records = [
+                    (edition["year"], edition["week"], tag, count)
+                    for edition in self._editions.values()
+                    for tag, count in edition["tags"].items()
+                ]
+                long = pd.DataFrame(records, columns=["year", "week", "tag", "count"])
+                weekly = long.pivot_table(
+                    index=["year", "week"], columns="tag", values="count",
+                    aggfunc="sum", fill_value=0,
+                ).sort_index()
+                self._tables = {
+                    "weekly": weekly,
+                    "yearly": weekly.groupby(level="year").sum(),
+                }
+            return self._tables
+
+
+@st.cache_resource
+def get_tag_rollups() -> TagRollups:
+    """
+    Return the process-wide tag rollups, shared by all sessions.
+    """
+    return TagRollups(TAG_ROLLUPS_PATH)
+
+
+def load_tag_tables() -> dict[str, "pd.DataFrame"]:
+    """
+    Return the weekly and yearly tag rollup tables, syncing them with the
+    edition catalog first (a no-op unless the catalog changed).
+    """
+    rollups = get_tag_rollups()
+    rollups.sync(get_edition_catalog())
+    return rollups.tables()
+
+
+def tag_trends(weekly: "pd.DataFrame", window: int = 4) -> "pd.DataFrame":
+    """
+    Compare each tag's mean weekly count over the last `window` editions with
+    the `window` editions before them. Returns one row per tag with "recent",
+    "previous" and "change" columns, sorted by change (rising tags first).
+    """
+    import pandas as pd
+    recent = weekly.tail(window).mean()
+    previous = weekly.iloc[-2 * window:-window].mean() if len(weekly) > window else recent * 0
+    trends = pd.DataFrame({"recent": recent, "previous": previous.fillna(0)})
+    trends["change"] = trends["recent"] - trends["previous"]
+    return trends.sort_values("change", ascending=False)
+
+
+# Maximum number of parsed editions kept in the shared content cache
+CONTENT_CACHE_SIZE = 64
+
+
+def _freeze(value):
+    """
+    Return a read-only view of parsed JSON: dicts become mappingproxy objects
+    and lists become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ContentCache:
+    """
+    Process-wide LRU cache of parsed editions, shared by all sessions.
+
+    Entries are validated against the file's (path, mtime, size) on every
+    lookup, so an edition overwritten by an editor is re-parsed on the next
+    request. Cached content is frozen (see `_freeze`): sessions share the same
+    object and cannot mutate each other's content.
+    """
+
+    def __init__(self, maxsize: int = CONTENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Path -> ((path, mtime_ns, size), frozen content)
+        self._entries: OrderedDict[str, tuple[tuple[str, int, int], Mapping]] = OrderedDict()
+
+    def get(self, path: str, load: Callable[[str], dict] | None = None) -> Mapping:
+        """
+        Return the frozen content of the edition at `path`, parsing it on a
+        miss, or building it with `load(path)` when given (e.g. compiling an
+        edition in memory). Raises OSError or ValueError if the file cannot be
+        read or parsed.
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        if load is None:
+            with open(path, "r", encoding="utf-8") as f:
+                user_content = json.load(f)
+        else:
+            user_content = load(path)
+        # Attach the base directory of this version for resolving relative audio paths
+        user_content["_base_dir"] = os.path.dirname(path)
+        content = _freeze(user_content)
+
+        with self._lock:
+            self._entries[path] = (key, content)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return content
+
+    def invalidate(self, path: str | None = None):
+        """Drop one edition, or every edition when `path` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+@st.cache_resource
+def get_content_cache() -> ContentCache:
+    """
+    Return the process-wide content cache, shared by all sessions.
+    """
+    return ContentCache()
+
+
+def load_content(file_path: str | None = None) -> Mapping | None:
+    """
+    Load newsletter content from a JSON file. If `file_path` is provided, it is
+    used directly; otherwise the newest edition in `content_versions`
+    directory is selected. When no JSON file is available, return None to
+    indicate that content is missing. JSON files should follow the structure of
+    the sample provided as a separate file. To add a new edition, place a
+    new JSON file named "week XX.json" into the `content_versions` folder.
+
+    Content comes from the shared content cache and is read-only; nested
+    dicts are mappings and lists are tuples.
+    """
+    # Determine which JSON file to load: use provided file_path or pick the most
+    # recent file from the available versions. The get_available_versions
+    # function returns absolute paths to JSON files.
+    version_file: str | None = None
+    if file_path:
+        version_file = file_path
+    else:
+        versions = get_available_versions()
+        if versions:
+            version_file = versions[0]
+    if not version_file or not os.path.isfile(version_file):
+        # No JSON content found
+        return None
+    try:
+        return get_content_cache().get(version_file)
+    except Exception as e:
+        st.warning(f"Could not load {version_file}: {e}.")
+        return None
+
+
+# Version of the render artifact layout; bump it to force a rebuild of every edition
+RENDER_ARTIFACT_VERSION = 1
+# Processes used by `python app.py build` (None: one per CPU)
+BUILD_WORKERS: int | None = None
+
+
+class EditionValidationError(ValueError):
+    """Raised when an edition JSON does not match the expected schema."""
+
+    def __init__(self, path: str, problems: list[str]):
+        self.path = path
+        self.problems = problems
+        super().__init__(f"{os.path.basename(path)}: " + "; ".join(problems))
+
+
+def _validate_edition(data) -> list[str]:
+    """
+    Check an edition against the JSON structure described at the top of this
+    file and return a list of problems (empty when the edition is valid).
+    """
+    if not isinstance(data, dict):
+        return ["top level must be an object"]
+    problems = []
+    for key in ("title", "subtitle", "period"):
+        if key in data and not isinstance(data[key], str):
+            problems.append(f"'{key}' must be a string")
+    for key in ("week_number", "year_number"):
+        if key in data and (not isinstance(data[key], int) or isinstance(data[key], bool)):
+            problems.append(f"'{key}' must be an integer")
+    if "audio_files" in data and not isinstance(data["audio_files"], dict):
+        problems.append("'audio_files' must be an object")
+    for section in ("top_developments", "regional_overviews"):
+        items = data.get(section, [])
+        if not isinstance(items, list):
+            problems.append(f"'{section}' must be a list")
+            continue
+        for idx, item in enumerate(items):
+            where = f"{section}[{idx}]"
+            if not isinstance(item, dict):
+                problems.append(f"{where} must be an object")
+                continue
+            for key in ("title", "description", "url_source"):
+                if item.get(key) is not None and not isinstance(item[key], str):
+                    problems.append(f"{where}.{key} must be a string")
+            tags = item.get("tags", [])
+            if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+                problems.append(f"{where}.tags must be a list of strings")
+    return problems
+
+
+def _render_item(item: dict, default_title: str) -> dict:
+    """Normalize an item and precompile its bullet markdown."""
+    title = (item.get("title") or "").strip() or default_title
+    url = (item.get("url_source") or "").strip()
+    tags = [tag.strip() for tag in item.get("tags", []) if tag.strip()]
+    # Construct bullet point with title, link icon and tags (as inline code)
+    bullet = f"- **{title}**"
+    if url:
+        bullet += f" [🔗]({url})"
+    if tags:
+        bullet += " " + " ".join([f"`{tag}`" for tag in tags])
+    return {
+        "title": title,
+        "url_source": url,
+        "tags": tags,
+        "description": (item.get("description") or "").strip(),
+        "bullet": bullet,
+    }
+
+
+def compile_edition(json_path: str) -> dict:
+    """
+    Validate and normalize an edition JSON and precompile everything `main()`
+    renders from it: the header HTML and the bullet markdown of every item.
+    Raises EditionValidationError for editions that do not match the schema.
+    """
+    stat = os.stat(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    problems = _validate_edition(data)
+    if problems:
+        raise EditionValidationError(json_path, problems)
+
+    # Compute values outside of the f-string to avoid backslash escapes
+    header_title = data.get("title", "Bram's AI Newsletter")
+    header_subtitle = data.get("subtitle", "")
+    header_period = data.get("period", "")
+    header_html = f"""
+        <div class="main-header">
+            <h1>{header_title}</h1>
+            <h3>{header_subtitle}</h3>
+            <p>{header_period}</p>
+        </div>
+        """
+    return {
+        "artifact_version": RENDER_ARTIFACT_VERSION,
+        "source": {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size},
+        "title": header_title,
+        "subtitle": header_subtitle,
+        "period": header_period,
+        "week_number": data.get("week_number"),
+        "year_number": data.get("year_number"),
+        "header_html": header_html,
+        "top_developments": [
+            _render_item(item, f"Item {idx + 1}")
+            for idx, item in enumerate(data.get("top_developments", []))
+        ],
+        "regional_overviews": [
+            _render_item(region, f"Region {idx + 1}")
+            for idx, region in enumerate(data.get("regional_overviews", []))
+        ],
+    }
+
+
+def get_artifact_path(json_path: str) -> str:
+    """
+    Path of the render artifact of an edition, a hidden file next to its JSON
+    (e.g. `Week 47/.Week 47 Y25.render.json`).
+    """
+    stem = os.path.splitext(os.path.basename(json_path))[0]
+    return os.path.join(os.path.dirname(json_path), f".{stem}.render.json")
+
+
+def _artifact_is_fresh(artifact: Mapping, json_path: str) -> bool:
+    try:
+        stat = os.stat(json_path)
+    except OSError:
+        return False
+    source = artifact.get("source") or {}
+    return (
+        artifact.get("artifact_version") == RENDER_ARTIFACT_VERSION
+        and source.get("mtime_ns") == stat.st_mtime_ns
+        and source.get("size") == stat.st_size
+    )
+
+
+def build_edition(json_path: str, force: bool = False) -> str:
+    """
+    Write the render artifact of one edition unless an up-to-date artifact
+    exists. Returns "built", "skipped" or "failed: <reason>".
+    """
+    artifact_path = get_artifact_path(json_path)
+    if not force:
+        try:
+            with open(artifact_path, "r", encoding="utf-8") as f:
+                if _artifact_is_fresh(json.load(f), json_path):
+                    return "skipped"
+        except (OSError, ValueError):
+            pass
+    try:
+        _write_json_atomic(artifact_path, compile_edition(json_path), ensure_ascii=False)
+    except (OSError, ValueError) as e:
+        return f"failed: {e}"
+    return "built"
+
+
+def _compile_render_artifact(json_path: str) -> dict:
+    """Compile an edition and write its render artifact if the volume allows it."""
+    artifact = compile_edition(json_path)
+    with contextlib.suppress(OSError):
+        _write_json_atomic(get_artifact_path(json_path), artifact, ensure_ascii=False)
+    return artifact
+
+
+def build_editions(json_paths: list[str], force: bool = False, workers: int | None = BUILD_WORKERS) -> dict[str, str]:
+    """
+    Build render artifacts for many editions in parallel with a process pool.
+    Returns the build_edition result per path.
+    """
+    if not json_paths:
+        return {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(build_edition, json_paths, [force] * len(json_paths))
+        return dict(zip(json_paths, results))
+
+
+@st.cache_resource
+def get_artifact_cache() -> ContentCache:
+    """
+    Return the process-wide cache of parsed render artifacts, shared by all sessions.
+    """
+    return ContentCache()
+
+
+def load_render_artifact(json_path: str) -> Mapping | None:
+    """
+    Load the precompiled render artifact of an edition. A missing or stale
+    artifact is rebuilt first; if it cannot be written (e.g. a read-only
+    volume) the compiled artifact is kept in the artifact cache, keyed by the
+    edition's mtime and size, so it is compiled once per change. Returns None,
+    after showing a warning, when the edition cannot be loaded or fails
+    validation.
+    """
+    with timed("load_render_artifact"):
+        return _load_render_artifact(json_path)
+
+
+def _load_render_artifact(json_path: str) -> Mapping | None:
+    artifact_path = get_artifact_path(json_path)
+    cache = get_artifact_cache()
+    with contextlib.suppress(OSError, ValueError):
+        artifact = cache.get(artifact_path)
+        if _artifact_is_fresh(artifact, json_path):
+            return artifact
+    try:
+        return cache.get(json_path, _compile_render_artifact)
+    except Exception as e:
+        st.warning(f"Could not load {json_path}: {e}.")
+        return None
+
+
+# Audio delivery. By default each audio file is read once per process and
+# handed to Streamlit's media endpoint, which answers HTTP range requests so
+# browsers can seek without downloading the whole file. When
+# NEWSLETTER_AUDIO_BASE_URL is set (e.g. a CDN, a reverse proxy serving
+# `content_versions`, or "/app/static/content_versions" with Streamlit static
+# serving), players are pointed at that URL and the app never reads audio bytes.
+AUDIO_BASE_URL = os.environ.get("NEWSLETTER_AUDIO_BASE_URL", "").rstrip("/")
+# Upper bound on audio bytes kept in memory per process in media mode
+AUDIO_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class AudioCache:
+    """
+    Process-wide cache of audio file contents, shared by all sessions.
+
+    Each file is read once per (path, mtime, size); sessions then pass the same
+    bytes object to `st.audio`, which Streamlit's media storage keeps by
+    reference. Least recently used files are evicted beyond `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = AUDIO_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = 0
+        # Path -> ((path, mtime_ns, size), data)
+        self._entries: OrderedDict[str, tuple[tuple[str, int, int], bytes]] = OrderedDict()
+
+    def get(self, path: str) -> bytes:
+        """Return the contents of `path`, reading the file only on a miss."""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(path)
+                return entry[1]
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total -= len(old[1])
+            self._entries[path] = (key, data)
+            self._total += len(data)
+            while self._total > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total -= len(evicted)
+        return data
+
+    def invalidate(self, path: str | None = None):
+        """Drop one audio file, or every file when `path` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._total = 0
+            else:
+                old = self._entries.pop(path, None)
+                if old is not None:
+                    self._total -= len(old[1])
+
+
+@st.cache_resource
+def get_audio_cache() -> AudioCache:
+    """
+    Return the process-wide audio cache, shared by all sessions.
+    """
+    return AudioCache()
+
+
+def get_audio_source(file_path: str) -> str | bytes:
+    """
+    Return what `st.audio` should play for an audio file: a URL below
+    AUDIO_BASE_URL when configured, otherwise the cached file contents.
+    """
+    if AUDIO_BASE_URL:
+        rel_path = os.path.relpath(file_path, CONTENT_DIR).replace(os.sep, "/")
+        return f"{AUDIO_BASE_URL}/{quote(rel_path)}"
+    with timed("get_audio_source"):
+        return get_audio_cache().get(file_path)
+
+
+# Audio metadata. Durations, sizes and bitrates of the fixed audio files are
+# read from the MP4 `moov/mvhd` header through mmap, so only the pages holding
+# box headers are touched, never the audio payload. Results are kept in a
+# hidden sidecar per week folder (`.audio.json`) and recomputed only when an
+# audio file's mtime or size changes.
+AUDIO_FILES = [
+    ("Executive Summary", "Executive Summary.m4a"),
+    ("Deep Dive", "Deep Dive.m4a"),
+]
+AUDIO_SIDECAR_NAME = ".audio.json"
+AUDIO_SIDECAR_VERSION = 1
+# Container boxes that are searched for the movie header
+_MP4_CONTAINERS = {b"moov", b"mvex"}
+
+
+class AudioMetadataError(ValueError):
+    """Raised when an audio file is not a readable MP4 container."""
+
+
+def _iter_mp4_boxes(data, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield (type, payload start, payload end) of the boxes between `start` and `end`."""
+    offset = start
+    while offset + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                raise AudioMetadataError(f"truncated {kind.decode('latin-1')} box at offset {offset}")
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            # The last box extends to the end of the file
+            size = end - offset
+        if size < header or offset + size > end:
+            raise AudioMetadataError(f"invalid {kind.decode('latin-1')} box size {size} at offset {offset}")
+        yield kind, offset + header, offset + size
+        offset += size
+
+
+def _find_mp4_box(data, path: list[bytes], start: int, end: int) -> tuple[int, int] | None:
+    for kind, payload_start, payload_end in _iter_mp4_boxes(data, start, end):
+        if kind == path[0]:
+            if len(path) == 1:
+                return payload_start, payload_end
+            if kind in _MP4_CONTAINERS:
+                return _find_mp4_box(data, path[1:], payload_start, payload_end)
+    return None
+
+
+def read_mp4_metadata(path: str) -> dict:
+    """
+    Read the duration and bitrate of an MP4/M4A file from its movie header
+    without reading the audio data. Fragmented files whose `mvhd` has no
+    duration fall back to `mvex/mehd`. Returns a dict with `size` (bytes),
+    `duration_seconds` (None if unknown) and `bitrate_kbps`. Raises
+    AudioMetadataError if the file is not a valid MP4 container.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 8:
+            raise AudioMetadataError("file too short for an MP4 container")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            mvhd = _find_mp4_box(data, [b"moov", b"mvhd"], 0, size)
+            if mvhd is None:
+                raise AudioMetadataError("no moov/mvhd movie header")
+            start, end = mvhd
+            version = data[start] if end > start else None
+            layout = {0: (">12xII", 20), 1: (">20xIQ", 32)}.get(version)
+            if layout is None or end - start < layout[1]:
+                raise AudioMetadataError("unsupported or truncated mvhd header")
+            timescale, duration = struct.unpack_from(layout[0], data, start)
+            if not duration or duration == 2 ** (32 if version == 0 else 64) - 1:
+                mehd = _find_mp4_box(data, [b"moov", b"mvex", b"mehd"], 0, size)
+                duration = 0
+                if mehd is not None and mehd[1] - mehd[0] >= 8:
+                    mehd_format = ">4xQ" if data[mehd[0]] == 1 else ">4xI"
+                    duration = struct.unpack_from(mehd_format, data, mehd[0])[0]
+    if not timescale:
+        raise AudioMetadataError("mvhd timescale is zero")
+    seconds = duration / timescale if duration else None
+    return {
+        "size": size,
+        "duration_seconds": seconds,
+        "bitrate_kbps": round(size * 8 / seconds / 1000, 1) if seconds else None,
+    }
+
+
+class AudioIndex:
+    """
+    Process-wide index of audio metadata per week folder, shared by all
+    sessions and backed by a `.audio.json` sidecar in each week folder.
+
+    A lookup stats the fixed audio files (see AUDIO_FILES); a file is parsed
+    again only when its mtime or size differs from the sidecar entry. Each
+    entry has a `status`: "ok", "missing" or "corrupt" (with an `error`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Week folder -> {file name: entry}
+        self._folders: dict[str, dict[str, dict]] = {}
+
+    def _read_sidecar(self, week_folder: str) -> dict[str, dict]:
+        try:
+            with open(os.path.join(week_folder, AUDIO_SIDECAR_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == AUDIO_SIDECAR_VERSION:
+                return dict(data["files"])
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        return {}
+
+    def _write_sidecar(self, week_folder: str, files: dict[str, dict]):
+        sidecar_path = os.path.join(week_folder, AUDIO_SIDECAR_NAME)
+        # The index still works in memory on a read-only volume
+        with contextlib.suppress(OSError):
+            _write_json_atomic(sidecar_path, {"version": AUDIO_SIDECAR_VERSION, "files": files}, indent=1)
+
+    def get(self, week_folder: str) -> dict[str, dict]:
+        """Return the metadata of the week's audio files, keyed by file name."""
+        with self._lock:
+            files = self._folders.get(week_folder)
+            if files is None:
+                files = self._folders[week_folder] = self._read_sidecar(week_folder)
+            changed = False
+            for _, filename in AUDIO_FILES:
+                path = os.path.join(week_folder, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    if files.get(filename, {}).get("status") != "missing":
+                        files[filename] = {"status": "missing"}
+                        changed = True
+                    continue
+                known = files.get(filename, {})
+                if known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size:
+                    continue
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+                try:
+                    entry.update(read_mp4_metadata(path), status="ok")
+                except (OSError, ValueError) as e:
+                    entry.update(status="corrupt", error=str(e))
+                files[filename] = entry
+                changed = True
+            if changed:
+                self._write_sidecar(week_folder, files)
+            return {filename: dict(entry) for filename, entry in files.items()}
+
+
+@st.cache_resource
+def get_audio_index() -> AudioIndex:
+    """
+    Return the process-wide audio metadata index, shared by all sessions.
+    """
+    return AudioIndex()
+
+
+def get_audio_metadata(week_folder: str) -> dict[str, dict]:
+    """
+    Return the metadata of the week's audio files (see AudioIndex), keyed by
+    file name.
+    """
+    with timed("get_audio_metadata"):
+        return get_audio_index().get(week_folder)
+
+
+def format_audio_metadata(entry: Mapping) -> str:
+    """Describe an audio file for the Listen section, e.g. "⏱️ 12:05 · 11.6 MB · 128 kbps"."""
+    parts = []
+    seconds = entry.get("duration_seconds")
+    if seconds:
+        minutes, seconds = divmod(round(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        parts.append(f"⏱️ {hours}:{minutes:02d}:{seconds:02d}" if hours else f"⏱️ {minutes}:{seconds:02d}")
+    if entry.get("size"):
+        parts.append(f"{entry['size'] / (1024 * 1024):.1f} MB")
+    if entry.get("bitrate_kbps"):
+        parts.append(f"{entry['bitrate_kbps']:.0f} kbps")
+    return " · ".join(parts)
+
+
+# Live content reloading. When watchdog is installed, a process-wide observer
+# watches `content_versions` (inotify on Linux, FSEvents on macOS) and updates
+# the edition catalog in the background, so runs never rescan the tree. Set
+# NEWSLETTER_WATCH=0 to fall back to refreshing the catalog on every run.
+WATCH_ENABLED = os.environ.get("NEWSLETTER_WATCH", "1") != "0"
+# Quiet period before the catalog is refreshed, so that a folder being copied
+# in is picked up once, after the copy finished
+WATCH_DEBOUNCE_SECONDS = 0.5
+AUDIO_EXTENSIONS = (".m4a", ".mp3")
+
+
+class _ContentEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "ContentWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        self.watcher.notify(os.fsdecode(event.src_path), event.is_directory)
+        if getattr(event, "dest_path", ""):
+            self.watcher.notify(os.fsdecode(event.dest_path), event.is_directory)
+
+
+class ContentWatcher:
+    """
+    Keeps the edition catalog and the content, artifact and audio caches in
+    sync with `content_versions` from filesystem events.
+
+    Events for edition JSON files and directories mark their directory dirty
+    in the catalog and drop the cached content; a background thread then
+    refreshes the catalog once events have settled. Hidden files (catalog,
+    render artifacts, feedback database) and feedback CSVs are ignored.
+    """
+
+    def __init__(
+        self, content_dir: str, catalog: EditionCatalog, content_cache: ContentCache,
+        artifact_cache: ContentCache, audio_cache: AudioCache,
+    ):
+        self.content_dir = content_dir
+        self.catalog = catalog
+        self.content_cache = content_cache
+        self.artifact_cache = artifact_cache
+        self.audio_cache = audio_cache
+        self.refreshes = 0
+        self._pending = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="content-watcher", daemon=True)
+        self._observer = Observer()
+        self._observer.schedule(_ContentEventHandler(self), content_dir, recursive=True)
+
+    def start(self):
+        """Start watching for changes, then refresh the catalog once."""
+        os.makedirs(self.content_dir, exist_ok=True)
+        self._observer.start()
+        refresh_catalog(self.catalog)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the observer and the refresh thread."""
+        self._stopped = True
+        self._pending.set()
+        self._observer.stop()
+
+    def is_alive(self) -> bool:
+        return not self._stopped and self._observer.is_alive() and self._thread.is_alive()
+
+    def notify(self, path: str, is_directory: bool):
+        """Handle a created, modified, deleted or moved path."""
+        rel_path = os.path.relpath(path, self.content_dir)
+        if rel_path.startswith(os.pardir) or any(
+            part.startswith(".") for part in rel_path.split(os.sep) if part != os.curdir
+        ):
+            return
+        name = os.path.basename(path)
+        if is_directory:
+            self.catalog.mark_dirty(path)
+            self.catalog.mark_dirty(os.path.dirname(path))
+        elif _is_edition_json(name):
+            self.catalog.mark_dirty(os.path.dirname(path))
+            self.content_cache.invalidate(path)
+            self.artifact_cache.invalidate(get_artifact_path(path))
+        elif name.lower().endswith(AUDIO_EXTENSIONS):
+            self.audio_cache.invalidate(path)
+            return
+        else:
+            return
+        self._pending.set()
+
+    def _run(self):
+        while not self._stopped:
+            self._pending.wait()
+            # Wait until no new event arrived for a whole debounce period
+            while not self._stopped:
+                self._pending.clear()
+                time.sleep(WATCH_DEBOUNCE_SECONDS)
+                if not self._pending.is_set():
+                    break
+            if self._stopped:
+                break
+            try:
+                if refresh_catalog(self.catalog):
+                    self.refreshes += 1
+            except Exception:
+                _LOGGER.exception("Could not refresh the edition catalog")
+
+
+@st.cache_resource
+def get_content_watcher() -> ContentWatcher | None:
+    """
+    Return the process-wide content watcher, or None when watching is disabled,
+    watchdog is not installed or the app is not running under Streamlit (e.g.
+    the command line), in which case callers refresh the catalog themselves.
+    """
+    if not WATCH_ENABLED or Observer is None or not st.runtime.exists():
+        return None
+    watcher = ContentWatcher(
+        CONTENT_DIR, get_edition_catalog(), get_content_cache(),
+        get_artifact_cache(), get_audio_cache(),
+    )
+    try:
+        watcher.start()
+    except OSError as e:
+        # E.g. the inotify watch limit was reached
+        _LOGGER.warning("Not watching %s for changes: %s", CONTENT_DIR, e)
+        watcher.stop()
+        return None
+    return watcher
+
+
+FEEDBACK_COLUMNS = ["Item", "Rating", "Comment", "Submitted At"]
+FEEDBACK_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_FEEDBACK_TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+# Feedback storage backend: "csv" (one feedback.csv per week folder) or
+# "sqlite" (a single indexed database, see SqliteFeedbackStore). Existing CSV
+# feedback is imported with `python app.py migrate-feedback`.
+FEEDBACK_BACKEND = os.environ.get("NEWSLETTER_FEEDBACK_BACKEND", "csv").lower()
+FEEDBACK_DB_PATH = os.environ.get(
+    "NEWSLETTER_FEEDBACK_DB", os.path.join(CONTENT_DIR, ".feedback", "feedback.sqlite3")
+)
+
+
+def get_feedback_path(week_folder: str) -> str:
+    """
+    Get the path to the feedback CSV file for a specific week folder.
+    """
+    return os.path.join(week_folder, "feedback.csv")
+
+
+def _lock_file(f):
+    """Take an exclusive cross-process lock on an open file (no-op without fcntl)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _encode_feedback_rows(rows: list[list[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _last_line_end(f, size: int, block_size: int = 64 * 1024) -> int:
+    """Return the offset just past the last newline before `size` (0 if none)."""
+    end = size
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        pos = f.read(end - start).rfind(b"\n")
+        if pos >= 0:
+            return start + pos + 1
+        end = start
+    return 0
+
+
+# Bytes at the end of a feedback CSV inspected for a last row without a newline
+FEEDBACK_TAIL_WINDOW = 1024 * 1024
+
+
+def _tail_is_complete(data: bytes) -> bool:
+    """
+    Return True when feedback CSV bytes end with a complete row: either a
+    newline, or a last row that parses as a full FEEDBACK_COLUMNS row with a
+    complete timestamp but no newline, as files edited by hand or written by
+    other tools often end. Anything else, including a row torn inside its
+    timestamp, is a torn write. A row with quoted newlines is followed back to
+    the line where its quotes balance.
+    """
+    if not data or data.endswith(b"\n"):
+        return True
+    pos = data.rfind(b"\n")
+    while True:
+        record = data[pos + 1:]
+        if record.count(b'"') % 2 == 0:
+            rows = list(csv.reader(io.StringIO(record.decode("utf-8", errors="replace"))))
+            return (
+                len(rows) == 1
+                and len(rows[0]) == len(FEEDBACK_COLUMNS)
+                and _FEEDBACK_TIMESTAMP_PATTERN.fullmatch(rows[0][-1]) is not None
+            )
+        if pos < 0:
+            return False
+        pos = data.rfind(b"\n", 0, pos)
+
+
+def _scan_rows(block: bytes, in_quotes: bool = False) -> tuple[int, bool]:
+    """
+    Scan feedback CSV bytes that continue a file at a row boundary, or inside
+    quotes when `in_quotes` is set. Returns the offset just past the block's
+    last newline outside quotes (-1 if there is none), and whether the block
+    ends inside quotes.
+    """
+    lines = block.split(b"\n")
+    last, offset = -1, 0
+    for line in lines[:-1]:
+        in_quotes ^= line.count(b'"') % 2 == 1
+        offset += len(line) + 1
+        if not in_quotes:
+            last = offset
+    in_quotes ^= lines[-1].count(b'"') % 2 == 1
+    return last, in_quotes
+
+
+def _complete_end(data: bytes) -> int:
+    """
+    Return the length of the leading part of feedback CSV bytes, starting at
+    a row boundary, that holds complete rows. A torn row is cut where it
+    starts, which may be before its last line when it has quoted newlines.
+    """
+    if _tail_is_complete(data):
+        return len(data)
+    return max(0, _scan_rows(data)[0])
+
+
+def _complete_size(f, size: int) -> int:
+    """Return the offset up to which a binary feedback CSV file holds complete rows."""
+    # Nearly every file ends with a newline; only scan the tail when it does not
+    if size:
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return size
+    start = max(0, size - FEEDBACK_TAIL_WINDOW)
+    f.seek(start)
+    if _tail_is_complete(f.read(size - start)):
+        return size
+    return _last_line_end(f, size)
+
+
+def _last_record_start(f, size: int, block_size: int = 64 * 1024) -> int:
+    """
+    Return the offset where the last row of a feedback CSV file starts: just
+    past the last newline outside quotes. Scans the whole file, so it is only
+    used to repair a torn write.
+    """
+    f.seek(0)
+    start = offset = 0
+    in_quotes = False
+    while offset < size:
+        block = f.read(min(block_size, size - offset))
+        if not block:
+            break
+        last, in_quotes = _scan_rows(block, in_quotes)
+        if last >= 0:
+            start = offset + last
+        offset += len(block)
+    return start
+
+
+def _iter_lines(f, end: int):
+    """Yield the lines of a binary file from its current position up to offset `end`."""
+    position = f.tell()
+    for line in f:
+        position += len(line)
+        if position > end:
+            return
+        yield line
+
+
+def _iter_lines_reversed(f, end: int, block_size: int = 64 * 1024):
+    """Yield the lines before offset `end` of a binary file, last line first, without newlines."""
+    remainder = b""
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        lines = (f.read(end - start) + remainder).split(b"\n")
+        end = start
+        # The first piece may continue in the previous block
+        remainder = lines[0]
+        yield from reversed(lines[1:])
+    if remainder:
+        yield remainder
+
+
+def _iter_rows_reversed(f, end: int) -> Iterator[list[str]]:
+    """
+    Yield the feedback rows before offset `end` of a binary CSV file, last row
+    first. Lines are joined back into one row while its quotes are unbalanced,
+    so comments containing newlines stay whole. The header and rows with the
+    wrong number of fields are skipped, as in _parse_feedback_csv. Raises
+    ValueError when the file starts inside an unbalanced row.
+    """
+    pending = None
+    for line in _iter_lines_reversed(f, end):
+        if pending is None and not line:
+            continue
+        record = line if pending is None else line + b"\n" + pending
+        if record.count(b'"') % 2:
+            pending = record
+            continue
+        pending = None
+        rows = list(csv.reader(io.StringIO(record.decode("utf-8", errors="replace"))))
+        if len(rows) == 1 and len(rows[0]) == len(FEEDBACK_COLUMNS) and rows[0] != FEEDBACK_COLUMNS:
+            yield rows[0]
+    if pending is not None:
+        raise ValueError("unbalanced quotes at the start of the feedback file")
+
+
+def append_feedback_rows(feedback_path: str, rows: list[list[str]]):
+    """
+    Append rows to a feedback CSV in O(1): the file is opened in append mode,
+    locked against other processes, written and fsync'ed before returning. The
+    header is written when the file is new. A trailing line left incomplete by
+    a crashed writer is truncated first so it cannot swallow the new rows; a
+    complete last row that only lacks its newline is kept and terminated.
+    """
+    with open(feedback_path, "ab+") as f:
+        _lock_file(f)
+        try:
+            size = f.seek(0, os.SEEK_END)
+            payload = _encode_feedback_rows(rows)
+            if size:
+                f.seek(size - 1)
+            # Reading the last byte is enough unless the file lacks a final newline
+            if size and f.read(1) != b"\n":
+                if _complete_size(f, size) < size:
+                    # Cut the torn row where it starts, which may be before its
+                    # last line when it has an unclosed quoted newline
+                    end = _last_record_start(f, size)
+                    f.truncate(end)
+                    size = end
+                else:
+                    payload = b"\n" + payload
+            if size == 0:
+                payload = _encode_feedback_rows([FEEDBACK_COLUMNS]) + payload
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            _unlock_file(f)
+
+
+def _parse_feedback_csv(data: bytes) -> list[list[str]]:
+    """
+    Parse feedback CSV bytes into rows, skipping the header. An incomplete
+    trailing line (a write in progress or a crashed writer, see
+    _tail_is_complete) and rows with the wrong number of fields are ignored.
+    """
+    text = data[:_complete_end(data)].decode("utf-8", errors="replace")
+    rows = [row for row in csv.reader(io.StringIO(text)) if len(row) == len(FEEDBACK_COLUMNS)]
+    if rows and rows[0] == FEEDBACK_COLUMNS:
+        rows = rows[1:]
+    return rows
+
+
+def get_edition_key(week_folder: str) -> str:
+    """
+    Identify an edition by its week folder relative to `content_versions`
+    (e.g. "Week 47"). Folders outside `content_versions` use their absolute path.
+    """
+    rel_path = os.path.relpath(os.path.abspath(week_folder), CONTENT_DIR)
+    if rel_path == os.curdir or rel_path.startswith(os.pardir):
+        return os.path.abspath(week_folder)
+    return rel_path.replace(os.sep, "/")
+
+
+def _edition_folder(edition: str) -> str:
+    return os.path.join(CONTENT_DIR, *edition.split("/"))
+
+
+class FeedbackStore(abc.ABC):
+    """
+    Interface for feedback storage. Editions are identified by their week
+    folder; rows are lists of strings in FEEDBACK_COLUMNS order, oldest first.
+    Backends implement the abstract methods; the others fall back to load()
+    and can be overridden with cheaper reads.
+    """
+
+    @abc.abstractmethod
+    def append(self, week_folder: str, rows: list[list[str]]):
+        """Durably store feedback rows for an edition."""
+
+    @abc.abstractmethod
+    def load(self, week_folder: str) -> list[list[str]]:
+        """Return all feedback rows for an edition."""
+
+    @abc.abstractmethod
+    def item_feedback(self, item_title: str) -> list[list[str]]:
+        """Return feedback for an item across editions, as [edition, *row] rows."""
+
+    def read_since(self, week_folder: str, cursor: int) -> tuple[list[list[str]], int, bool]:
+        """
+        Return the edition's rows added after `cursor` (0 reads from the start),
+        the cursor to pass next time and whether the stored feedback was
+        replaced, in which case the rows start over from the beginning.
+        """
+        rows = self.load(week_folder)
+        if cursor > len(rows):
+            return rows, len(rows), True
+        return rows[cursor:], len(rows), False
+
+    @abc.abstractmethod
+    def latest(self, limit: int) -> list[list[str]]:
+        """Return the newest `limit` rows across editions, newest first, as [edition, *row] rows."""
+
+    def iter_chunks(self, week_folder: str, chunk_size: int) -> Iterator[list[list[str]]]:
+        """Yield an edition's rows, oldest first, in lists of at most `chunk_size` rows."""
+        rows = self.load(week_folder)
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+
+    def page(
+        self, week_folder: str, offset: int, limit: int,
+        item: str | None = None, rating: str | None = None,
+    ) -> tuple[list[list[str]], bool]:
+        """
+        Return one page of an edition's feedback, newest first, optionally
+        filtered by item title and rating, and whether older rows remain.
+        """
+        rows = [
+            row for row in reversed(self.load(week_folder))
+            if (item is None or row[0] == item) and (rating is None or row[1] == rating)
+        ]
+        return rows[offset:offset + limit], len(rows) > offset + limit
+
+
+class CsvFeedbackStore(FeedbackStore):
+    """
+    Feedback stored as one append-only `feedback.csv` per week folder.
+    Cross-edition queries have to read every edition's file.
+    """
+
+    def append(self, week_folder: str, rows: list[list[str]]):
+        append_feedback_rows(get_feedback_path(week_folder), rows)
+
+    def load(self, week_folder: str) -> list[list[str]]:
+        feedback_path = get_feedback_path(week_folder)
+        if not os.path.isfile(feedback_path):
+            return []
+        with open(feedback_path, "rb") as f:
+            return _parse_feedback_csv(f.read())
+
+    def page(
+        self, week_folder: str, offset: int, limit: int,
+        item: str | None = None, rating: str | None = None,
+    ) -> tuple[list[list[str]], bool]:
+        # Read the file backwards and stop as soon as the page is full, so the
+        # newest pages cost the same regardless of the file's length. A file
+        # that cannot be split into rows from the end is read forwards instead.
+        feedback_path = get_feedback_path(week_folder)
+        if not os.path.isfile(feedback_path):
+            return [], False
+        rows: list[list[str]] = []
+        skipped = 0
+        with open(feedback_path, "rb") as f:
+            end = _complete_size(f, f.seek(0, os.SEEK_END))
+            try:
+                for row in _iter_rows_reversed(f, end):
+                    if (item is not None and row[0] != item) or (rating is not None and row[1] != rating):
+                        continue
+                    if skipped < offset:
+                        skipped += 1
+                        continue
+                    if len(rows) == limit:
+                        return rows, True
+                    rows.append(row)
+            except ValueError:
+                return super().page(week_folder, offset, limit, item, rating)
+        return rows, False
+
+    def read_since(self, week_folder: str, cursor: int) -> tuple[list[list[str]], int, bool]:
+        # The cursor is a byte offset just past the last complete row read. It
+        # never moves into a torn row, whose start is found by _complete_end
+        feedback_path = get_feedback_path(week_folder)
+        try:
+            size = os.path.getsize(feedback_path)
+        except OSError:
+            return [], 0, cursor > 0
+        reset = size < cursor
+        if reset:
+            cursor = 0
+        if size == cursor:
+            return [], cursor, reset
+        with open(feedback_path, "rb") as f:
+            f.seek(cursor)
+            data = f.read(size - cursor)
+        end = _complete_end(data)
+        text = data[:end].decode("utf-8", errors="replace")
+        rows = [row for row in csv.reader(io.StringIO(text)) if len(row) == len(FEEDBACK_COLUMNS)]
+        if cursor == 0 and rows and rows[0] == FEEDBACK_COLUMNS:
+            rows = rows[1:]
+        return rows, cursor + end, reset
+
+    def iter_chunks(self, week_folder: str, chunk_size: int) -> Iterator[list[list[str]]]:
+        # Stream the file line by line up to its last complete row, so an
+        # append in progress is skipped like in _parse_feedback_csv
+        feedback_path = get_feedback_path(week_folder)
+        if not os.path.isfile(feedback_path):
+            return
+        with open(feedback_path, "rb") as f:
+            end = _complete_size(f, f.seek(0, os.SEEK_END))
+            f.seek(0)
+            reader = csv.reader(
+                line.decode("utf-8", errors="replace")
+                for line in _iter_lines(f, end)
+            )
+            rows = (row for row in reader if len(row) == len(FEEDBACK_COLUMNS) and row != FEEDBACK_COLUMNS)
+            while chunk := list(itertools.islice(rows, chunk_size)):
+                yield chunk
+
+    def _all_rows(self) -> list[list[str]]:
+        rows: list[list[str]] = []
+        folders = {os.path.dirname(path) for path in get_available_versions()}
+        for week_folder in sorted(folders):
+            edition = get_edition_key(week_folder)
+            rows.extend([edition, *row] for row in self.load(week_folder))
+        return rows
+
+    def item_feedback(self, item_title: str) -> list[list[str]]:
+        return [row for row in self._all_rows() if row[1] == item_title]
+
+    def latest(self, limit: int) -> list[list[str]]:
+        # Timestamps sort chronologically; sorting the reversed rows keeps later
+        # rows first among entries submitted in the same second
+        rows = sorted(self._all_rows()[::-1], key=lambda row: row[4], reverse=True)
+        return rows[:limit]
+
+
+class SqliteFeedbackStore(FeedbackStore):
+    """
+    Feedback stored in a single SQLite database in WAL mode, indexed by edition
+    and by item. WAL lets readers proceed while another worker is writing; each
+    thread uses its own connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feedback (
+            id INTEGER PRIMARY KEY,
+            edition TEXT NOT NULL,
+            item TEXT NOT NULL,
+            rating TEXT NOT NULL DEFAULT '',
+            comment TEXT NOT NULL,
+            submitted_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS feedback_edition ON feedback (edition, id);
+        CREATE INDEX IF NOT EXISTS feedback_item ON feedback (item, id);
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or os.curdir, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # FULL syncs the WAL on every commit, matching the CSV backend's fsync
+            conn.execute("PRAGMA synchronous=FULL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, week_folder: str, rows: list[list[str]]):
+        self.append_edition(get_edition_key(week_folder), rows)
+
+    def append_edition(self, edition: str, rows: list[list[str]]):
+        """Store rows for an edition given by its key (see get_edition_key)."""
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO feedback (edition, item, rating, comment, submitted_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(edition, *row) for row in rows],
+            )
+
+    def load(self, week_folder: str) -> list[list[str]]:
+        cursor = self._connection().execute(
+            "SELECT item, rating, comment, submitted_at FROM feedback"
+            " WHERE edition = ? ORDER BY id",
+            (get_edition_key(week_folder),),
+        )
+        return [list(row) for row in cursor]
+
+    def page(
+        self, week_folder: str, offset: int, limit: int,
+        item: str | None = None, rating: str | None = None,
+    ) -> tuple[list[list[str]], bool]:
+        query = "SELECT item, rating, comment, submitted_at FROM feedback WHERE edition = ?"
+        params: list = [get_edition_key(week_folder)]
+        if item is not None:
+            query += " AND item = ?"
+            params.append(item)
+        if rating is not None:
+            query += " AND rating = ?"
+            params.append(rating)
+        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+        params += [limit + 1, offset]
+        rows = [list(row) for row in self._connection().execute(query, params)]
+        return rows[:limit], len(rows) > limit
+
+    def read_since(self, week_folder: str, cursor: int) -> tuple[list[list[str]], int, bool]:
+        # The cursor is the highest row id read so far. When that row is gone
+        # the edition was replaced (see replace_edition), so read it again from
+        # the start. One query keeps the check and the rows consistent.
+        edition = get_edition_key(week_folder)
+        conn = self._connection()
+        result = conn.execute(
+            "SELECT id, item, rating, comment, submitted_at FROM feedback"
+            " WHERE edition = ? AND id >= ? ORDER BY id",
+            (edition, cursor),
+        ).fetchall()
+        reset = cursor > 0 and (not result or result[0][0] != cursor)
+        if reset:
+            result = conn.execute(
+                "SELECT id, item, rating, comment, submitted_at FROM feedback"
+                " WHERE edition = ? ORDER BY id",
+                (edition,),
+            ).fetchall()
+        elif result and result[0][0] == cursor:
+            result = result[1:]
+        if not result:
+            return [], 0 if reset else cursor, reset
+        return [list(row[1:]) for row in result], result[-1][0], reset
+
+    def item_feedback(self, item_title: str) -> list[list[str]]:
+        cursor = self._connection().execute(
+            "SELECT edition, item, rating, comment, submitted_at FROM feedback"
+            " WHERE item = ? ORDER BY id",
+            (item_title,),
+        )
+        return [list(row) for row in cursor]
+
+    def latest(self, limit: int) -> list[list[str]]:
+        cursor = self._connection().execute(
+            "SELECT edition, item, rating, comment, submitted_at FROM feedback"
+            " ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+        return [list(row) for row in cursor]
+
+    def iter_chunks(self, week_folder: str, chunk_size: int) -> Iterator[list[list[str]]]:
+        cursor = self._connection().execute(
+            "SELECT item, rating, comment, submitted_at FROM feedback"
+            " WHERE edition = ? ORDER BY id",
+            (get_edition_key(week_folder),),
+        )
+        while chunk := cursor.fetchmany(chunk_size):
+            yield [list(row) for row in chunk]
+
+    def edition_count(self, edition: str) -> int:
+        """Return the number of rows stored for an edition key."""
+        cursor = self._connection().execute(
+            "SELECT COUNT(*) FROM feedback WHERE edition = ?", (edition,)
+        )
+        return cursor.fetchone()[0]
+
+    def replace_edition(self, edition: str, rows: list[list[str]]):
+        """
+        Replace every row of an edition key in one transaction. The new rows
+        are inserted before the old ones are deleted, so they get ids above
+        every old id and read_since cursors into the old rows report a reset.
+        """
+        conn = self._connection()
+        with conn:
+            (last_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM feedback").fetchone()
+            conn.executemany(
+                "INSERT INTO feedback (edition, item, rating, comment, submitted_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(edition, *row) for row in rows],
+            )
+            conn.execute("DELETE FROM feedback WHERE edition = ? AND id <= ?", (edition, last_id))
+
+
+@st.cache_resource
+def get_feedback_store() -> FeedbackStore:
+    """
+    Return the process-wide feedback store selected by
+    NEWSLETTER_FEEDBACK_BACKEND ("csv" or "sqlite").
+    """
+    if FEEDBACK_BACKEND == "sqlite":
+        return SqliteFeedbackStore(FEEDBACK_DB_PATH)
+    if FEEDBACK_BACKEND != "csv":
+        raise ValueError(f"Unknown feedback backend {FEEDBACK_BACKEND!r}; use 'csv' or 'sqlite'.")
+    return CsvFeedbackStore()
+
+
+def save_feedback(item_title: str, feedback: str, rating: str, week_folder: str):
+    """
+    Save feedback for an item of the week's edition in the configured feedback store.
+    With the CSV backend each week has its own append-only feedback file.
+
+    Parameters:
+        item_title: The title of the item receiving feedback.
+        feedback: The comment provided by the user.
+        rating: The rating (thumbs up/down or other).
+        week_folder: The folder path for the current week.
+    """
+    if not feedback.strip():
+        return
+
+    timestamp = datetime.now().strftime(FEEDBACK_TIMESTAMP_FORMAT)
+    get_feedback_store().append(
+        week_folder,
+        [[item_title, rating if rating else "", feedback.strip(), timestamp]],
+    )
+
+
+# Background feedback writer: submissions are queued and written in batches of
+# up to FEEDBACK_BATCH_SIZE rows, or after FEEDBACK_FLUSH_SECONDS, whichever
+# comes first. When the queue is full for FEEDBACK_QUEUE_TIMEOUT seconds the
+# submission is written synchronously instead, so feedback is never dropped.
+# A failed write is retried every FEEDBACK_RETRY_SECONDS; meanwhile new rows
+# stay queued, so a lasting failure fills the queue and surfaces in the
+# submitting session through the synchronous write.
+FEEDBACK_QUEUE_SIZE = 1000
+FEEDBACK_BATCH_SIZE = 100
+FEEDBACK_FLUSH_SECONDS = 0.5
+FEEDBACK_QUEUE_TIMEOUT = 1.0
+FEEDBACK_RETRY_SECONDS = 1.0
+
+# Sentinel that tells the writer thread to flush and exit
+_STOP_WRITER = object()
+
+
+class FeedbackWriter:
+    """
+    In-process writer thread with a bounded queue, shared by all sessions.
+    Rows are grouped per edition so each flush is one append (or transaction)
+    per edition. Rows whose append fails are retried until it succeeds or the
+    writer is closed. Pending rows are flushed at interpreter shutdown, and
+    rows submitted after close are written synchronously.
+    """
+
+    def __init__(
+        self, store: FeedbackStore, maxsize: int = FEEDBACK_QUEUE_SIZE,
+        batch_size: int = FEEDBACK_BATCH_SIZE, flush_interval: float = FEEDBACK_FLUSH_SECONDS,
+        retry_interval: float = FEEDBACK_RETRY_SECONDS,
+    ):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._metrics = {
+            "submitted": 0,
+            "written": 0,
+            "failed": 0,
+            "retried": 0,
+            "written_synchronously": 0,
+            "flushes": 0,
+            "last_flush_seconds": 0.0,
+            "max_flush_seconds": 0.0,
+        }
+        self._thread = threading.Thread(target=self._run, name="feedback-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, week_folder: str, row: list[str]) -> bool:
+        """
+        Queue a feedback row for the edition in `week_folder`. Returns True
+        once the row is queued, or False if it was written synchronously
+        because the queue stayed full or the writer is closed. A synchronous
+        write raises the store's error.
+        """
+        with self._lock:
+            self._metrics["submitted"] += 1
+        if self._stopping.is_set() or not self._thread.is_alive():
+            return self._write_synchronously(week_folder, row)
+        try:
+            self._queue.put((week_folder, row), timeout=FEEDBACK_QUEUE_TIMEOUT)
+        except queue.Full:
+            return self._write_synchronously(week_folder, row)
+        if not self._thread.is_alive():
+            # The writer exited while the row was queued; close() may have
+            # drained the queue already, so write what is left here
+            self._flush(self._drain(), retry=False)
+        return True
+
+    def _write_synchronously(self, week_folder: str, row: list[str]) -> bool:
+        try:
+            self.store.append(week_folder, [row])
+        except Exception:
+            with self._lock:
+                self._metrics["failed"] += 1
+            raise
+        with self._lock:
+            self._metrics["written"] += 1
+            self._metrics["written_synchronously"] += 1
+        return False
+
+    def _collect(self) -> tuple[list[tuple[str, list[str]]], bool]:
+        """
+        Wait for rows and collect them until the batch is full or the flush
+        interval ends. Returns the batch and whether the writer is stopping.
+        """
+        entry = self._queue.get()
+        if entry is _STOP_WRITER:
+            return [], True
+        batch = [entry]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is _STOP_WRITER:
+                return batch, True
+            batch.append(entry)
+        return batch, self._stopping.is_set()
+
+    def _drain(self) -> list[tuple[str, list[str]]]:
+        """Take every row still queued without waiting."""
+        batch = []
+        with contextlib.suppress(queue.Empty):
+            while True:
+                entry = self._queue.get_nowait()
+                if entry is not _STOP_WRITER:
+                    batch.append(entry)
+        return batch
+
+    def _run(self):
+        pending: list[tuple[str, list[str]]] = []
+        stopping = False
+        while not stopping:
+            if pending:
+                # Retry before taking new rows, which stay queued meanwhile
+                stopping = self._stopping.wait(self.retry_interval)
+                batch = pending
+            else:
+                batch, stopping = self._collect()
+            if stopping:
+                # Drain whatever is still queued before exiting
+                batch += self._drain()
+            pending = self._flush(batch, retry=not stopping)
+
+    def _flush(self, batch: list[tuple[str, list[str]]], retry: bool = True) -> list[tuple[str, list[str]]]:
+        """
+        Append a batch, one append per edition. Returns the rows of editions
+        whose append failed when `retry` is set; otherwise they are logged and
+        counted as failed.
+        """
+        if not batch:
+            return []
+        grouped: dict[str, list[list[str]]] = {}
+        for week_folder, row in batch:
+            grouped.setdefault(week_folder, []).append(row)
+        started = time.perf_counter()
+        written = failed = 0
+        pending = []
+        for week_folder, rows in grouped.items():
+            try:
+                self.store.append(week_folder, rows)
+                written += len(rows)
+            except Exception:
+                if retry:
+                    _LOGGER.warning(
+                        "Could not write %d feedback rows for %s; retrying", len(rows), week_folder, exc_info=True,
+                    )
+                    pending += [(week_folder, row) for row in rows]
+                else:
+                    _LOGGER.exception("Could not write %d feedback rows for %s", len(rows), week_folder)
+                    failed += len(rows)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._metrics["written"] += written
+            self._metrics["failed"] += failed
+            self._metrics["retried"] += len(pending)
+            self._metrics["flushes"] += 1
+            self._metrics["last_flush_seconds"] = elapsed
+            self._metrics["max_flush_seconds"] = max(self._metrics["max_flush_seconds"], elapsed)
+        return pending
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every row submitted so far has been written. Returns False
+        if that did not happen within `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                done = self._metrics["written"] + self._metrics["failed"] >= self._metrics["submitted"]
+            if done:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def close(self, timeout: float = 10.0):
+        """
+        Flush pending rows and stop the writer thread. Rows submitted
+        afterwards are written synchronously.
+        """
+        self._stopping.set()
+        # A full queue keeps the writer busy; it sees the event after its batch
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(_STOP_WRITER)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._flush(self._drain(), retry=False)
+
+    def metrics(self) -> dict:
+        """Return queue depth, row counters and flush latency."""
+        with self._lock:
+            return {"queue_depth": self._queue.qsize(), **self._metrics}
+
+
+@st.cache_resource
+def get_feedback_writer() -> FeedbackWriter:
+    """
+    Return the process-wide background feedback writer.
+    """
+    return FeedbackWriter(get_feedback_store())
+
+
+def submit_feedback(item_title: str, feedback: str, rating: str, week_folder: str) -> bool:
+    """
+    Queue feedback for the background writer and return immediately. Returns
+    True when the feedback was accepted (queued or, with a full queue, written),
+    False when there was nothing to save. Use save_feedback to write synchronously.
+
+    Parameters:
+        item_title: The title of the item receiving feedback.
+        feedback: The comment provided by the user.
+        rating: The rating (thumbs up/down or other).
+        week_folder: The folder path for the current week.
+    """
+    if not feedback.strip():
+        return False
+
+    timestamp = datetime.now().strftime(FEEDBACK_TIMESTAMP_FORMAT)
+    get_feedback_writer().submit(
+        week_folder, [item_title, rating if rating else "", feedback.strip(), timestamp]
+    )
+    return True
+
+
+class FeedbackTable:
+    """
+    Lightweight, read-only table of feedback rows. Loading and showing
+    feedback uses it instead of a pandas DataFrame, so only the analytics and
+    trends views import pandas. Iterating yields rows as tuples in `columns`
+    order; `to_pandas` converts the table when a DataFrame is needed.
+    """
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, rows: list[list[str]], columns: Sequence[str] = FEEDBACK_COLUMNS):
+        self.columns = tuple(columns)
+        self.rows = [tuple(row) for row in rows]
 
+    def __len__(self) -> int:
+        return len(self.rows)
 
-def get_available_versions() -> list[str]:
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        return iter(self.rows)
+
+    @property
+    def empty(self) -> bool:
+        return not self.rows
+
+    def column(self, name: str) -> list[str]:
+        """Return the values of one column."""
+        index = self.columns.index(name)
+        return [row[index] for row in self.rows]
+
+    def records(self) -> list[dict[str, str]]:
+        """Return the rows as dicts keyed by column name."""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Return the table as a DataFrame, importing pandas on first use."""
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=list(self.columns))
+
+
+def load_feedback(week_folder: str) -> FeedbackTable:
     """
-    Recursively scan the `content_versions` directory for JSON files. Returns a
-    list of absolute paths to JSON files sorted by modification time (most
-    recent first). If the directory does not exist, it will be created.
+    Load feedback for the week's edition from the configured feedback store.
+
+    Parameters:
+        week_folder: The folder path for the current week.
+
+    Returns:
+        FeedbackTable with feedback entries, empty if no feedback exists.
     """
-    if not os.path.isdir(CONTENT_DIR):
-        os.makedirs(CONTENT_DIR, exist_ok=True)
-    json_paths: list[str] = []
-    for root, _, filenames in os.walk(CONTENT_DIR):
-        for name in filenames:
-            if name.lower().endswith(".json"):
-                json_paths.append(os.path.join(root, name))
-    json_paths.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-    return json_paths
+    return FeedbackTable(get_feedback_store().load(week_folder))
 
 
-def load_content(file_path: str | None = None):
+def load_feedback_page(
+    week_folder: str, page: int, page_size: int = 20,
+    item: str | None = None, rating: str | None = None,
+) -> tuple[list[list[str]], bool]:
     """
-    Load newsletter content from a JSON file. If `file_path` is provided, it is
-    used directly; otherwise the most recent JSON file in `content_versions`
-    directory is selected. When no JSON file is available, return None to
-    indicate that content is missing. JSON files should follow the structure of
-    the sample provided as a separate file. To add a new edition, place a
-    new JSON file named "week XX.json" into the `content_versions` folder.
+    Load one page of the week's feedback, newest first, reading only as much of
+    the store as the page needs.
+
+    Parameters:
+        week_folder: The folder path for the current week.
+        page: Zero-based page number.
+        page_size: Number of entries per page.
+        item: Only return feedback for this item title.
+        rating: Only return feedback with this rating ("" for unrated).
+
+    Returns:
+        The page's rows in FEEDBACK_COLUMNS order and whether older rows exist.
     """
-    # Determine which JSON file to load: use provided file_path or pick the most
-    # recent file from the available versions. The get_available_versions
-    # function returns absolute paths to JSON files.
-    version_file: str | None = None
-    if file_path:
-        version_file = file_path
+    with timed("load_feedback_page"):
+        return get_feedback_store().page(week_folder, page * page_size, page_size, item, rating)
+
+
+# Feedback exports. Rows are read from the feedback store and written to the
+# output FEEDBACK_EXPORT_CHUNK_ROWS at a time, so export_feedback's memory use
+# does not depend on the amount of feedback. A download from the UI still holds
+# the whole file in memory (see feedback_export_file); `python app.py
+# export-feedback` writes straight to a file. Format -> (file extension, MIME type).
+FEEDBACK_EXPORT_CHUNK_ROWS = 5000
+FEEDBACK_EXPORT_FORMATS = {
+    "csv.gz": (".csv.gz", "application/gzip"),
+    "zip": (".zip", "application/zip"),
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+
+def _write_feedback_csv(out: BinaryIO, chunks: Iterator[list[list[str]]], columns: list[str]):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(columns)
+    for chunk in chunks:
+        writer.writerows(chunk)
+    text.flush()
+    # Leave `out` open for the caller
+    text.detach()
+
+
+def export_feedback(week_folders: list[str], fmt: str, out: BinaryIO, edition_column: bool = True):
+    """
+    Write the feedback of several editions to the binary file `out`.
+
+    Parameters:
+        week_folders: Folder paths of the editions to export, in export order.
+        fmt: One of FEEDBACK_EXPORT_FORMATS: "csv" or "csv.gz" for a single
+            CSV, "zip" for one CSV per edition, or "parquet" for a single
+            Parquet file with one row group per chunk.
+        edition_column: Prefix single-file exports with an "Edition" column.
+            Per-edition CSVs in a "zip" export never have one.
+    """
+    store = get_feedback_store()
+
+    def edition_chunks(week_folder: str) -> Iterator[list[list[str]]]:
+        edition = get_edition_key(week_folder)
+        for chunk in store.iter_chunks(week_folder, FEEDBACK_EXPORT_CHUNK_ROWS):
+            yield [[edition, *row] for row in chunk] if edition_column else chunk
+
+    all_chunks = itertools.chain.from_iterable(map(edition_chunks, week_folders))
+    columns = ["Edition", *FEEDBACK_COLUMNS] if edition_column else FEEDBACK_COLUMNS
+    if fmt == "csv":
+        _write_feedback_csv(out, all_chunks, columns)
+    elif fmt == "csv.gz":
+        with gzip.GzipFile(fileobj=out, mode="wb") as compressed:
+            _write_feedback_csv(compressed, all_chunks, columns)
+    elif fmt == "zip":
+        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for week_folder in week_folders:
+                name = f"{get_edition_key(week_folder).strip('/')}/feedback.csv"
+                with archive.open(name, "w", force_zip64=True) as member:
+                    _write_feedback_csv(
+                        member, store.iter_chunks(week_folder, FEEDBACK_EXPORT_CHUNK_ROWS),
+                        FEEDBACK_COLUMNS,
+                    )
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        with pq.ParquetWriter(out, schema) as writer:
+            for chunk in all_chunks:
+                writer.write_table(pa.Table.from_pylist(
+                    [dict(zip(columns, row)) for row in chunk], schema=schema
+                ))
     else:
-        versions = get_available_versions()
-        if versions:
-            version_file = versions[0]
-    if not version_file or not os.path.isfile(version_file):
-        # No JSON content found
-        return None
+        raise ValueError(f"Unknown export format {fmt!r}; use one of {', '.join(FEEDBACK_EXPORT_FORMATS)}.")
+
+
+def feedback_export_file(week_folders: list[str], fmt: str, edition_column: bool = True) -> bytes:
+    """
+    Export feedback (see export_feedback) for `st.download_button` and return
+    the file's contents. The export is written in chunks to an anonymous
+    temporary file, but `st.download_button` needs the whole file as bytes, so
+    the finished export is held in memory (and in Streamlit's media storage)
+    until it is downloaded. Use `python app.py export-feedback` for exports too
+    large for that. Pass it as a callable so the export only runs when the user
+    clicks the button.
+    """
+    with timed("feedback_export_file"):
+        with tempfile.TemporaryFile() as out:
+            export_feedback(week_folders, fmt, out, edition_column)
+            out.seek(0)
+            return out.read()
+
+
+def load_item_feedback(item_title: str) -> FeedbackTable:
+    """
+    Load feedback for one item across all editions, with an "Edition" column.
+    """
+    rows = get_feedback_store().item_feedback(item_title)
+    return FeedbackTable(rows, ["Edition", *FEEDBACK_COLUMNS])
+
+
+def load_latest_feedback(limit: int = 20) -> FeedbackTable:
+    """
+    Load the newest `limit` feedback entries across all editions, newest first.
+    """
+    rows = get_feedback_store().latest(limit)
+    return FeedbackTable(rows, ["Edition", *FEEDBACK_COLUMNS])
+
+
+def migrate_feedback(db_path: str = "", replace: bool = False) -> dict[str, int]:
+    """
+    Bulk-import every `feedback.csv` below `content_versions` into the SQLite
+    feedback database. Editions that already have rows in the database are
+    skipped unless `replace` is set, so the migration can be re-run safely.
+    Returns the number of imported rows per edition.
+    """
+    store = SqliteFeedbackStore(db_path or FEEDBACK_DB_PATH)
+    csv_store = CsvFeedbackStore()
+    imported: dict[str, int] = {}
+    for root, dirnames, filenames in os.walk(CONTENT_DIR):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        if "feedback.csv" not in filenames:
+            continue
+        edition = get_edition_key(root)
+        if store.edition_count(edition) and not replace:
+            continue
+        rows = csv_store.load(root)
+        store.replace_edition(edition, rows)
+        imported[edition] = len(rows)
+    return imported
+
+
+def cli(argv: list[str] | None = None) -> int:
+    """
+    Maintenance commands, run with `python app.py <command>`.
+    """
+    parser = argparse.ArgumentParser(prog="app.py", description="Newsletter maintenance commands.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser(
+        "migrate-feedback",
+        help="import existing feedback.csv files into the SQLite feedback database",
+    )
+    migrate.add_argument("--db", default="", help=f"database path (default: {FEEDBACK_DB_PATH})")
+    migrate.add_argument(
+        "--replace", action="store_true",
+        help="re-import editions that already have rows in the database",
+    )
+    build = commands.add_parser(
+        "build", help="validate editions and precompile their render artifacts",
+    )
+    build.add_argument("--force", action="store_true", help="rebuild unchanged editions too")
+    build.add_argument("--workers", type=int, default=BUILD_WORKERS, help="number of processes")
+    commands.add_parser(
+        "index-audio", help="update the audio metadata sidecars and report missing or corrupt audio",
+    )
+    export = commands.add_parser(
+        "export-feedback", help="export the feedback of a range of editions",
+    )
+    export.add_argument("output", help="output file ('-' for stdout)")
+    export.add_argument(
+        "--format", choices=list(FEEDBACK_EXPORT_FORMATS), default="csv.gz", help="output format",
+    )
+    export.add_argument("--from", dest="first", help="oldest edition label to export (e.g. 'Week 44 Y25')")
+    export.add_argument("--to", dest="last", help="newest edition label to export")
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate-feedback":
+        imported = migrate_feedback(args.db, args.replace)
+        for edition, count in sorted(imported.items()):
+            print(f"{edition}: {count} rows")
+        print(f"Imported {sum(imported.values())} rows from {len(imported)} editions.")
+    elif args.command == "build":
+        # List editions without refresh_catalog, which would build them one by one here
+        catalog = get_edition_catalog()
+        catalog.refresh()
+        results = build_editions([entry["path"] for entry in catalog.editions()], args.force, args.workers)
+        for path, result in results.items():
+            print(f"{os.path.relpath(path, CONTENT_DIR)}: {result}")
+        failed = sum(result.startswith("failed") for result in results.values())
+        print(f"{len(results) - failed} editions up to date, {failed} failed.")
+        return 1 if failed else 0
+    elif args.command == "index-audio":
+        index = AudioIndex()
+        corrupt = 0
+        for path in get_available_versions():
+            for filename, entry in index.get(os.path.dirname(path)).items():
+                details = format_audio_metadata(entry) if entry["status"] == "ok" else entry.get("error", "")
+                print(f"{edition_label(path)}: {filename}: {entry['status']} {details}".rstrip())
+                corrupt += entry["status"] == "corrupt"
+        print(f"{corrupt} corrupt audio files.")
+        return 1 if corrupt else 0
+    elif args.command == "export-feedback":
+        # Oldest edition first
+        paths = get_available_versions()[::-1]
+        labels = [edition_label(path) for path in paths]
+        for label in (args.first, args.last):
+            if label is not None and label not in labels:
+                parser.error(f"unknown edition {label!r}; choose from {', '.join(labels)}")
+        start = labels.index(args.first) if args.first else 0
+        stop = labels.index(args.last) + 1 if args.last else len(labels)
+        week_folders = [os.path.dirname(path) for path in paths[start:stop]]
+        if args.output == "-":
+            export_feedback(week_folders, args.format, sys.stdout.buffer)
+        else:
+            with open(args.output, "wb") as out:
+                export_feedback(week_folders, args.format, out)
+        print(f"Exported feedback of {len(week_folders)} editions.", file=sys.stderr)
+    return 0
+
+
+FEEDBACK_AGGREGATES_PATH = os.path.join(CACHE_DIR, "feedback_aggregates.json")
+FEEDBACK_AGGREGATES_VERSION = 1
+
+
+class FeedbackAggregates:
+    """
+    Rating counts per edition and item, shared by all sessions and persisted
+    in `.cache/feedback_aggregates.json`.
+
+    Each edition keeps a store cursor (see FeedbackStore.read_since), so a sync
+    only reads feedback appended since the previous one instead of re-reading
+    every week's feedback.
+    """
+
+    def __init__(self, aggregates_path: str, store: FeedbackStore, backend: str):
+        self.aggregates_path = aggregates_path
+        self.store = store
+        self.backend = backend
+        self._lock = threading.Lock()
+        # Edition key -> {"cursor": int, "last_submitted": str, "items": {item: {rating: count}}}
+        self._editions: dict[str, dict] = {}
+        try:
+            with open(aggregates_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Cursors are only meaningful for the backend that produced them
+            if data.get("version") == FEEDBACK_AGGREGATES_VERSION and data.get("backend") == backend:
+                self._editions = data["editions"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _save(self):
+        data = {
+            "version": FEEDBACK_AGGREGATES_VERSION,
+            "backend": self.backend,
+            "editions": self._editions,
+        }
+        with contextlib.suppress(OSError):
+            _write_json_atomic(self.aggregates_path, data, ensure_ascii=False)
+
+    def sync(self, week_folders: list[str]):
+        """Fold feedback appended since the last sync into the counts."""
+        with self._lock:
+            dirty = False
+            for week_folder in week_folders:
+                edition = get_edition_key(week_folder)
+                state = self._editions.get(edition) or {"cursor": 0, "last_submitted": "", "items": {}}
+                rows, cursor, reset = self.store.read_since(week_folder, state["cursor"])
+                if reset:
+                    state = {"cursor": 0, "last_submitted": "", "items": {}}
+                if not rows and cursor == state["cursor"] and not reset:
+                    continue
+                for item, rating, _, submitted_at in rows:
+                    counts = state["items"].setdefault(item, {})
+                    counts[rating] = counts.get(rating, 0) + 1
+                    state["last_submitted"] = max(state["last_submitted"], submitted_at)
+                state["cursor"] = cursor
+                self._editions[edition] = state
+                dirty = True
+            if dirty:
+                self._save()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Return a copy of the per-edition counts."""
+        with self._lock:
+            return json.loads(json.dumps(self._editions))
+
+
+@st.cache_resource
+def get_feedback_aggregates() -> FeedbackAggregates:
+    """
+    Return the process-wide feedback aggregates for the configured store.
+    """
+    return FeedbackAggregates(FEEDBACK_AGGREGATES_PATH, get_feedback_store(), FEEDBACK_BACKEND)
+
+
+def _item_sections(json_path: str) -> dict[str, str]:
+    """Map item titles of an edition to their section, from its render artifact."""
     try:
-        with open(version_file, "r", encoding="utf-8") as f:
-            user_content = json.load(f)
-        # Attach the base directory of this version for resolving relative audio paths
-        user_content["_base_dir"] = os.path.dirname(version_file)
-        return user_content
-    except Exception as e:
-        st.warning(f"Could not load {version_file}: {e}.")
-        return None
+        artifact = get_artifact_cache().get(get_artifact_path(json_path))
+    except (OSError, ValueError):
+        try:
+            artifact = compile_edition(json_path)
+        except (OSError, ValueError):
+            return {}
+    sections = {}
+    for section in ("regional_overviews", "top_developments"):
+        for item in artifact[section]:
+            sections[item["title"]] = section
+    return sections
 
 
-def get_feedback_path(week_folder: str) -> str:
+def load_feedback_stats() -> "pd.DataFrame":
     """
-    Get the path to the feedback CSV file for a specific week folder.
+    Return one row per edition and item with 👍/👎/unrated counts, built from
+    the incrementally updated feedback aggregates. Columns: edition, label,
+    year, week, section, item, up, down, unrated, total.
     """
-    return os.path.join(week_folder, "feedback.csv")
+    import pandas as pd
+    with timed("load_feedback_stats"):
+        get_available_versions()
+        editions = get_edition_catalog().editions()
+        folders = {os.path.dirname(entry["path"]): entry for entry in editions}
+        aggregates = get_feedback_aggregates()
+        aggregates.sync(list(folders))
+        snapshot = aggregates.snapshot()
 
+        records = []
+        for week_folder, entry in folders.items():
+            state = snapshot.get(get_edition_key(week_folder))
+            if not state:
+                continue
+            sections = _item_sections(entry["path"])
+            for item, counts in state["items"].items():
+                up, down = counts.get("👍", 0), counts.get("👎", 0)
+                total = sum(counts.values())
+                records.append((
+                    get_edition_key(week_folder), edition_label(entry["path"]),
+                    entry["year_number"] or 0, entry["week_number"] or 0,
+                    sections.get(item, "other"), item, up, down, total - up - down, total,
+                ))
+        return pd.DataFrame(records, columns=[
+            "edition", "label", "year", "week", "section", "item",
+            "up", "down", "unrated", "total",
+        ])
 
-def save_feedback(item_title: str, feedback: str, rating: str, week_folder: str):
+
+def _with_ratio(frame: "pd.DataFrame") -> "pd.DataFrame":
+    rated = frame["up"] + frame["down"]
+    frame["👍 ratio"] = (frame["up"] / rated.where(rated > 0)).round(2)
+    return frame
+
+
+# Seconds between automatic refreshes of the feedback section, which picks up
+# submissions from item widgets (and other sessions) without a full-page rerun
+FEEDBACK_REFRESH_SECONDS = 10
+
+
+def _set_rating(rating_key: str, rating: str):
+    st.session_state[rating_key] = rating
+
+
+def _submit_item_feedback(section: str, idx: int, title: str, week_folder: str):
+    user_feedback = st.session_state.get(f"text_{section}_{idx}", "")
+    submit_feedback(title, user_feedback, st.session_state[f"rating_{section}_{idx}"], week_folder)
+    st.session_state.feedback[title] = user_feedback
+    st.session_state[f"submitted_{section}_{idx}"] = True
+
+
+@st.fragment
+def render_item_interaction(section: str, idx: int, title: str, week_folder: str):
     """
-    Save feedback to a CSV file in the week's folder. Each week has its own feedback file.
+    Render the rating buttons and feedback form of one item. The widgets form a
+    fragment, so a rating click or a submission reruns only this item instead of
+    the whole page. State changes happen in widget callbacks, before the
+    fragment reruns, so the buttons always show the current rating.
 
     Parameters:
-        item_title: The title of the item receiving feedback.
-        feedback: The comment provided by the user.
-        rating: The rating (thumbs up/down or other).
+        section: Key prefix of the item's section ("top" or "region").
+        idx: Position of the item within its section.
+        title: The title of the item receiving feedback.
         week_folder: The folder path for the current week.
     """
-    if not feedback.strip():
-        return
+    # Initialize rating and submission state for this item if not present
+    rating_key = f"rating_{section}_{idx}"
+    submit_key = f"submitted_{section}_{idx}"
+    if rating_key not in st.session_state:
+        st.session_state[rating_key] = ""
+    if submit_key not in st.session_state:
+        st.session_state[submit_key] = False
+
+    current = st.session_state[rating_key]
+    up_label = "🟢👍" if current == "👍" else "👍"
+    down_label = "🔴👎" if current == "👎" else "👎"
+    up_col, down_col = st.columns([1, 1])
+    with up_col:
+        st.button(
+            up_label, key=f"up_btn_{section}_{idx}",
+            on_click=_set_rating, args=(rating_key, "👍"),
+        )
+    with down_col:
+        st.button(
+            down_label, key=f"down_btn_{section}_{idx}",
+            on_click=_set_rating, args=(rating_key, "👎"),
+        )
+
+    # Arrange feedback input and submit checkbox horizontally
+    input_col, button_col = st.columns([4, 1])
+    with input_col:
+        st.text_input(
+            label="", key=f"text_{section}_{idx}",
+            placeholder="Your feedback..."
+        )
+    with button_col:
+        # Show green checkmark if already submitted, otherwise white checkbox
+        if st.session_state[submit_key]:
+            st.markdown("✅", unsafe_allow_html=True)
+        else:
+            st.button(
+                "☑️", key=f"button_{section}_{idx}",
+                on_click=_submit_item_feedback, args=(section, idx, title, week_folder),
+            )
+
+
+# Items rendered per section before a "Show more" button. Items further down,
+# with their widgets and session state, are only created once shown, so the
+# first paint does not depend on the size of the edition.
+ITEMS_PAGE_SIZE = 10
 
-    feedback_path = get_feedback_path(week_folder)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Create new feedback entry
-    new_entry = pd.DataFrame([{
-        "Item": item_title,
-        "Rating": rating if rating else "",
-        "Comment": feedback.strip(),
-        "Submitted At": timestamp
-    }])
-
-    # Append to existing file or create new one
-    if os.path.isfile(feedback_path):
-        existing_df = pd.read_csv(feedback_path)
-        updated_df = pd.concat([existing_df, new_entry], ignore_index=True)
-    else:
-        updated_df = new_entry
 
-    updated_df.to_csv(feedback_path, index=False)
+def _show_more_items(shown_key: str, count: int):
+    st.session_state[shown_key] = count
 
 
-def load_feedback(week_folder: str) -> pd.DataFrame:
+@st.fragment
+def render_section_items(section: str, items: Sequence[Mapping], week_folder: str):
     """
-    Load feedback from the CSV file in the week's folder.
+    Render the items of a section, ITEMS_PAGE_SIZE at a time. "Show more"
+    reruns only this section and adds the next page of items below.
 
     Parameters:
+        section: Key prefix of the section ("top" or "region").
+        items: Precompiled items of the section (see compile_edition).
         week_folder: The folder path for the current week.
+    """
+    shown_key = f"shown_{section}"
+    shown = st.session_state.get(shown_key, ITEMS_PAGE_SIZE)
+    for idx, item in enumerate(items[:shown]):
+        # Create two columns: left for article, right for interaction
+        # Use a wider article column and narrower interaction column for compact layout
+        article_col, interact_col = st.columns([4, 2])
+        with article_col:
+            # Precompiled bullet point with title, link icon and tags
+            st.markdown(item["bullet"])
+            # Show description as a short summary below the bullet
+            st.markdown(item["description"])
+        with interact_col:
+            render_item_interaction(section, idx, item["title"], week_folder)
 
-    Returns:
-        DataFrame with feedback entries, or empty DataFrame if no feedback exists.
+    remaining = len(items) - shown
+    if remaining > 0:
+        st.button(
+            f"Show {min(remaining, ITEMS_PAGE_SIZE)} more ({remaining} not shown)",
+            key=f"more_{section}", on_click=_show_more_items,
+            args=(shown_key, shown + ITEMS_PAGE_SIZE),
+        )
+
+
+# Number of feedback entries shown per page of the feedback section
+FEEDBACK_PAGE_SIZE = 20
+FEEDBACK_RATING_FILTERS = {"All ratings": None, "👍": "👍", "👎": "👎", "No rating": ""}
+
+
+def _reset_feedback_page(page_key: str):
+    st.session_state[page_key] = 0
+
+
+def _change_feedback_page(page_key: str, delta: int):
+    st.session_state[page_key] = max(0, st.session_state.get(page_key, 0) + delta)
+
+
+@st.fragment(run_every=FEEDBACK_REFRESH_SECONDS)
+def render_feedback_section(week_folder: str, selected_label: str | None, item_titles: list[str]):
+    """
+    Render the feedback collected for the current edition, newest first, one
+    page at a time with item and rating filters. Only the displayed page is
+    read from the feedback store; the CSV download is generated when the
+    button is clicked. Runs as a fragment that refreshes itself every
+    FEEDBACK_REFRESH_SECONDS.
+    """
+    st.markdown("---")
+    st.markdown(f"## Feedback for {selected_label or 'Current Edition'}")
+
+    edition = get_edition_key(week_folder)
+    page_key = f"feedback_page_{edition}"
+    if page_key not in st.session_state:
+        st.session_state[page_key] = 0
+
+    item_col, rating_col = st.columns([3, 1])
+    with item_col:
+        item_choice = st.selectbox(
+            "Item", ["All items", *item_titles], key=f"feedback_item_{edition}",
+            on_change=_reset_feedback_page, args=(page_key,),
+        )
+    with rating_col:
+        rating_choice = st.selectbox(
+            "Rating", list(FEEDBACK_RATING_FILTERS), key=f"feedback_rating_{edition}",
+            on_change=_reset_feedback_page, args=(page_key,),
+        )
+    item_filter = None if item_choice == "All items" else item_choice
+    rating_filter = FEEDBACK_RATING_FILTERS[rating_choice]
+
+    page = st.session_state[page_key]
+    rows, has_more = load_feedback_page(
+        week_folder, page, FEEDBACK_PAGE_SIZE, item_filter, rating_filter
+    )
+    filtered = item_filter is not None or rating_filter is not None
+
+    if not rows and page == 0:
+        st.info("No matching feedback." if filtered else "No feedback submitted yet.")
+        return
+
+    # Display each feedback entry of the current page
+    for item, rating, comment, submitted_at in rows:
+        st.markdown(f"**{item}** {rating} ({submitted_at}): {comment}")
+
+    newer_col, page_col, older_col = st.columns([1, 2, 1])
+    with newer_col:
+        st.button(
+            "← Newer", key=f"feedback_newer_{edition}", disabled=page == 0,
+            on_click=_change_feedback_page, args=(page_key, -1),
+        )
+    with page_col:
+        st.caption(f"Page {page + 1}")
+    with older_col:
+        st.button(
+            "Older →", key=f"feedback_older_{edition}", disabled=not has_more,
+            on_click=_change_feedback_page, args=(page_key, 1),
+        )
+
+    # Provide a download button for feedback CSV; the callable defers building
+    # the file until the user clicks
+    st.download_button(
+        label="Download feedback as CSV",
+        data=lambda: feedback_export_file([week_folder], "csv", edition_column=False),
+        file_name=f"feedback_{selected_label or 'current'}.csv",
+        mime="text/csv",
+    )
+
+
+def render_trends_view():
+    """
+    Render the Trends view: tag frequency per week and per year, plus the tags
+    rising and falling most over a selectable window of recent editions.
+    """
+    st.markdown("## 📈 Tag Trends")
+    tables = load_tag_tables()
+    weekly, yearly = tables["weekly"], tables["yearly"]
+    if weekly.empty:
+        st.info("No tagged items yet.")
+        return
+
+    top_tags = weekly.sum().sort_values(ascending=False)
+    st.markdown("### Most frequent tags")
+    st.bar_chart(top_tags.head(20))
+
+    st.markdown("### Tag frequency per week")
+    selected_tags = st.multiselect(
+        "Tags", list(top_tags.index), default=list(top_tags.index[:5]), key="trend_tags",
+    )
+    if selected_tags:
+        by_week = weekly[selected_tags].copy()
+        by_week.index = [f"{year}-W{week:02d}" for year, week in by_week.index]
+        st.line_chart(by_week)
+
+    st.markdown("### Tag frequency per year")
+    st.dataframe(yearly[top_tags.index[:20]].T, width="stretch")
+
+    st.markdown("### Rising and falling tags")
+    max_window = max(1, len(weekly) // 2)
+    window = 1
+    if max_window > 1:
+        window = st.slider(
+            "Editions to compare", 1, max_window, min(4, max_window), key="trend_window",
+        )
+    trends = tag_trends(weekly, window)
+    rising_col, falling_col = st.columns(2)
+    with rising_col:
+        st.markdown("**Rising**")
+        st.dataframe(trends[trends["change"] > 0].head(10), width="stretch")
+    with falling_col:
+        st.markdown("**Falling**")
+        st.dataframe(
+            trends[trends["change"] < 0].sort_values("change").head(10),
+            width="stretch",
+        )
+
+
+def render_feedback_analytics_view():
+    """
+    Render the feedback analytics view: 👍/👎 ratios per item and section,
+    engagement per edition and a week-by-week comparison.
+    """
+    st.markdown("## 📊 Feedback Analytics")
+    stats = load_feedback_stats()
+    if stats.empty:
+        st.info("No feedback submitted yet.")
+        return
+
+    total_col, editions_col, ratio_col = st.columns(3)
+    rated = stats["up"].sum() + stats["down"].sum()
+    total_col.metric("Feedback entries", int(stats["total"].sum()))
+    editions_col.metric("Editions with feedback", stats["edition"].nunique())
+    ratio_col.metric("👍 ratio", f"{stats['up'].sum() / rated:.0%}" if rated else "–")
+
+    st.markdown("### Engagement per edition")
+    per_edition = _with_ratio(
+        stats.groupby(["year", "week", "label"])[["up", "down", "unrated", "total"]].sum()
+    ).reset_index(level=["year", "week"], drop=True)
+    st.bar_chart(per_edition[["up", "down", "unrated"]])
+    st.line_chart(per_edition[["👍 ratio"]])
+
+    st.markdown("### Ratios per section")
+    per_section = _with_ratio(stats.groupby("section")[["up", "down", "unrated", "total"]].sum())
+    st.dataframe(per_section, width="stretch")
+
+    st.markdown("### Ratios per item")
+    labels = ["All editions", *per_edition.index[::-1]]
+    edition_choice = st.selectbox("Edition", labels, key="analytics_edition")
+    items = stats if edition_choice == "All editions" else stats[stats["label"] == edition_choice]
+    per_item = _with_ratio(
+        items.groupby(["item", "section"])[["up", "down", "unrated", "total"]].sum()
+    ).sort_values("total", ascending=False)
+    st.dataframe(per_item, width="stretch")
+
+    render_feedback_export()
+
+
+def render_feedback_export():
+    """
+    Render the export of feedback for a range of editions, or all of them.
+    The file is only generated when the download button is clicked.
+    """
+    st.markdown("### Export feedback")
+    # Oldest edition first, so the range reads left to right
+    editions = get_edition_catalog().editions()[::-1]
+    labels = [edition_label(entry["path"]) for entry in editions]
+    all_editions = st.checkbox("All editions", value=True, key="export_all")
+    if all_editions or len(labels) < 2:
+        selected = editions
+    else:
+        first, last = st.select_slider(
+            "Editions", labels, value=(labels[0], labels[-1]), key="export_range"
+        )
+        selected = editions[labels.index(first):labels.index(last) + 1]
+    fmt = st.selectbox(
+        "Format", list(FEEDBACK_EXPORT_FORMATS), key="export_format",
+        format_func=lambda name: {
+            "csv.gz": "CSV (gzip)", "zip": "ZIP, one CSV per edition",
+            "csv": "CSV", "parquet": "Parquet",
+        }[name],
+    )
+    week_folders = [os.path.dirname(entry["path"]) for entry in selected]
+    extension, mime = FEEDBACK_EXPORT_FORMATS[fmt]
+    st.download_button(
+        label=f"Download feedback of {len(week_folders)} editions",
+        data=lambda: feedback_export_file(week_folders, fmt),
+        file_name=f"feedback{extension}", mime=mime, key="export_download",
+    )
+    st.caption(
+        "Downloads are built in the app's memory. For large exports, run "
+        "`python app.py export-feedback FILE --format FORMAT --from EDITION --to EDITION` "
+        "on the server instead."
+    )
+
+
+# Seconds between checks of the edition catalog for editions added while a
+# session is open (only with a content watcher, which keeps the catalog current)
+EDITION_CHECK_SECONDS = 15
+
+
+@st.fragment(run_every=EDITION_CHECK_SECONDS)
+def render_edition_notice(seen_generation: int, newest_path: str | None):
+    """
+    Tell the session when the catalog changed since its last full run, with
+    a button that reruns the whole page to pick up the new editions.
     """
-    feedback_path = get_feedback_path(week_folder)
-    if os.path.isfile(feedback_path):
-        return pd.read_csv(feedback_path)
-    return pd.DataFrame(columns=["Item", "Rating", "Comment", "Submitted At"])
+    catalog = get_edition_catalog()
+    if catalog.generation == seen_generation:
+        return
+    editions = catalog.editions()
+    newest = editions[0]["path"] if editions else None
+    if newest and newest != newest_path:
+        st.info(f"🆕 New edition available: {edition_label(newest)}")
+    else:
+        st.info("🔄 Editions were updated.")
+    if st.button("Reload", key="btn_reload_editions", width="stretch"):
+        st.rerun()
 
 
 def main():
+    """
+    Render the newsletter page, collecting stage timings when enabled (see
+    TIMINGS_ENABLED) or requested with `?debug=1`.
+    """
+    show_panel = st.query_params.get("debug") == "1"
+    run = RunTimings() if TIMINGS_ENABLED or show_panel else None
+    token = _RUN_TIMINGS.set(run)
+    try:
+        edition = render_newsletter()
+    finally:
+        _RUN_TIMINGS.reset(token)
+    if run is not None:
+        report_run_timings(run, edition, show_panel)
+    if METRICS_PORT:
+        start_metrics_server(METRICS_PORT)
+
+
+def render_newsletter() -> str | None:
+    """
+    Render the page for the selected edition and return its label.
+    """
     # Configure page
     st.set_page_config(page_title="Aviation Weekly Briefing", layout="wide")
 
@@ -261,6 +3416,8 @@ def main():
         """,
         unsafe_allow_html=True,
     )
+    lap("css")
+
     # Sidebar: Theme toggle
     st.sidebar.markdown("### 🎨 Theme")
     theme_col1, theme_col2 = st.sidebar.columns(2)
@@ -278,6 +3435,23 @@ def main():
     st.sidebar.markdown(f"**Current:** {current_mode}")
     st.sidebar.markdown("---")
 
+    # Sidebar: switch between the newsletter and cross-edition views
+    view = st.sidebar.radio(
+        "View", ["📰 Newsletter", "📈 Trends", "📊 Feedback"], key="view", horizontal=True
+    )
+    st.sidebar.markdown("---")
+    if view == "📈 Trends":
+        get_available_versions()
+        lap("sidebar")
+        render_trends_view()
+        lap("trends")
+        return None
+    if view == "📊 Feedback":
+        lap("sidebar")
+        render_feedback_analytics_view()
+        lap("feedback_analytics")
+        return None
+
     # Determine available content versions and allow the user to choose
     versions = get_available_versions()
     selected_content_file = None
@@ -287,61 +3461,74 @@ def main():
         version_options: list[tuple[str, str]] = []
         for path in versions:
             # Display name uses the base filename without extension (e.g., 'Week 44 Y25')
-            base = os.path.splitext(os.path.basename(path))[0]
-            version_options.append((base, path))
+            version_options.append((edition_label(path), path))
+        labels = [disp for disp, _ in version_options]
+
+        # Sidebar search across all editions; a result switches to its edition
+        st.sidebar.markdown("### 🔎 Search")
+        query = st.sidebar.text_input(
+            "Search all editions", key="search_query",
+            placeholder="e.g. Guangzhou electric GSE",
+        )
+        if query.strip():
+            results = search_editions(query)
+            if not results:
+                st.sidebar.caption("No matching items.")
+            for rank, result in enumerate(results):
+                st.sidebar.button(
+                    f"{result['title']} · {result['label']}", key=f"search_result_{rank}",
+                    help=result["snippet"], on_click=_select_edition, args=(result["label"],),
+                    width="stretch",
+                )
+        st.sidebar.markdown("---")
+
         # Sidebar selection for available versions
         st.sidebar.markdown("### Previous Editions")
-        labels = [disp for disp, _ in version_options]
-        # default index 0 is the most recently modified edition
+        if get_content_watcher() is not None:
+            with st.sidebar:
+                render_edition_notice(get_edition_catalog().generation, versions[0])
+        # Drop a remembered selection whose edition no longer exists
+        if st.session_state.get("selected_edition") not in labels:
+            st.session_state.pop("selected_edition", None)
+        # default index 0 is the newest edition by year and week number
         # Use radio buttons instead of a dropdown so editions appear as a list
         selected_label = st.sidebar.radio(
-            "Choose an edition to view", labels, index=0
+            "Choose an edition to view", labels,
+            index=0 if "selected_edition" not in st.session_state else None,
+            key="selected_edition",
         )
         # Find the corresponding file path for the selected label
         for disp, path in version_options:
             if disp == selected_label:
                 selected_content_file = path
                 break
+    lap("sidebar")
 
-    # Load content from the selected file (or default if none)
-    content = load_content(selected_content_file)
+    # Load the precompiled render artifact of the selected edition
+    content = load_render_artifact(selected_content_file) if selected_content_file else None
+    lap("content")
 
     # If no content JSON is available, show a placeholder message
     if content is None:
         st.title("Bram's AI Newsletter")
         st.write("json file with articles missing")
-        return
+        return selected_label
 
     # Get the base directory for the current week (for feedback storage)
     week_folder = content.get("_base_dir")
 
     # Header: use a custom HTML container to apply the aviation-themed styling
-    # Compute values outside of the f-string to avoid backslash escapes
-    header_title = content.get("title", "Bram's AI Newsletter")
-    header_subtitle = content.get("subtitle", "")
-    header_period = content.get("period", "")
-    st.markdown(
-        f"""
-        <div class="main-header">
-            <h1>{header_title}</h1>
-            <h3>{header_subtitle}</h3>
-            <p>{header_period}</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(content["header_html"], unsafe_allow_html=True)
 
     # Listen section: Display two podcast columns for Executive Summary and Deep Dive.
-    # Audio files always have fixed names in each week folder
+    # Audio files always have fixed names in each week folder (see AUDIO_FILES);
+    # their status, duration and size come from the audio metadata sidecar
     base_dir = content.get("_base_dir")
-    audio_files = [
-        ("Executive Summary", "Executive Summary.m4a"),
-        ("Deep Dive", "Deep Dive.m4a")
-    ]
+    audio_metadata = get_audio_metadata(base_dir) if base_dir else {}
 
     st.markdown('<h2>🎧 Listen</h2>', unsafe_allow_html=True)
-    cols = st.columns(len(audio_files))
-    for (label, filename), col in zip(audio_files, cols):
+    cols = st.columns(len(AUDIO_FILES))
+    for (label, filename), col in zip(AUDIO_FILES, cols):
         with col:
             # Show podcast box with title
             st.markdown(
@@ -350,19 +3537,29 @@ def main():
             )
             # Resolve audio file path relative to the JSON's base directory
             file_path = os.path.join(base_dir, filename) if base_dir else filename
-            # Check if file exists and play audio
-            if os.path.isfile(file_path):
+            metadata = audio_metadata.get(filename, {"status": "missing"})
+            # Play existing audio; corrupt files are flagged but still offered
+            if metadata["status"] == "missing":
+                st.warning(f"Audio file '{filename}' not found. Please upload it.")
+            else:
+                if metadata["status"] == "corrupt":
+                    st.warning(f"Audio file '{filename}' looks corrupt: {metadata.get('error')}.")
                 ext = os.path.splitext(file_path)[1].lower()
                 mime = "audio/mp3" if ext == ".mp3" else "audio/mp4"
-                with open(file_path, "rb") as af:
-                    st.audio(af.read(), format=mime)
-            else:
-                st.warning(f"Audio file '{filename}' not found. Please upload it.")
+                st.audio(get_audio_source(file_path), format=mime)
+                st.caption(format_audio_metadata(metadata))
             st.markdown('</div>', unsafe_allow_html=True)
 
+    lap("header_audio")
+
     # Initialize feedback storage in session state
     if "feedback" not in st.session_state:
         st.session_state.feedback = {}
+    # Start every newly selected edition with the first page of each section
+    if st.session_state.get("shown_edition") != selected_label:
+        st.session_state.shown_edition = selected_label
+        for section in ("top", "region"):
+            st.session_state.pop(f"shown_{section}", None)
 
     st.markdown("---")
     st.markdown("## 1.0 Top Developments")
@@ -371,66 +3568,8 @@ def main():
         "Key events span critical areas from ambitious regulatory mandates and significant financial turnarounds to severe operational pressures and new strategic partnerships."
     )
 
-    # Display each top development in full with rating and feedback form
-    for idx, item in enumerate(content.get("top_developments", [])):
-        title = item.get("title", f"Item {idx + 1}")
-        desc = item.get("description", "")
-        # Create two columns: left for article, right for interaction
-        # Use a wider article column and narrower interaction column for compact layout
-        article_col, interact_col = st.columns([4, 2])
-        with article_col:
-            # Construct bullet point with title, link icon and tags
-            url = item.get("url_source")
-            tags = item.get("tags", [])
-            bullet = f"- **{title}**"
-            if url:
-                bullet += f" [🔗]({url})"
-            if tags:
-                # Display tags as inline code
-                bullet += " " + " ".join([f"`{tag}`" for tag in tags])
-            st.markdown(bullet)
-            # Show description as a short summary below the bullet
-            st.markdown(item.get("description", ""))
-        with interact_col:
-            # Initialize rating and submission state for this item if not present
-            rating_key = f"rating_top_{idx}"
-            submit_key = f"submitted_top_{idx}"
-            if rating_key not in st.session_state:
-                st.session_state[rating_key] = ""
-            if submit_key not in st.session_state:
-                st.session_state[submit_key] = False
-
-            current = st.session_state[rating_key]
-            up_label = "🟢👍" if current == "👍" else "👍"
-            down_label = "🔴👎" if current == "👎" else "👎"
-            up_col, down_col = st.columns([1, 1])
-            with up_col:
-                if st.button(up_label, key=f"up_btn_top_{idx}"):
-                    st.session_state[rating_key] = "👍"
-                    st.rerun()
-            with down_col:
-                if st.button(down_label, key=f"down_btn_top_{idx}"):
-                    st.session_state[rating_key] = "👎"
-                    st.rerun()
-
-            rating = st.session_state[rating_key]
-            # Arrange feedback input and submit checkbox horizontally
-            input_col, button_col = st.columns([4, 1])
-            with input_col:
-                user_feedback = st.text_input(
-                    label="", key=f"text_top_{idx}",
-                    placeholder="Your feedback..."
-                )
-            with button_col:
-                # Show green checkmark if already submitted, otherwise white checkbox
-                if st.session_state[submit_key]:
-                    st.markdown("✅", unsafe_allow_html=True)
-                else:
-                    if st.button("☑️", key=f"button_top_{idx}"):
-                        save_feedback(title, user_feedback, rating, week_folder)
-                        st.session_state.feedback[title] = user_feedback
-                        st.session_state[submit_key] = True
-                        st.rerun()
+    # Display the top developments in full with rating and feedback form, a page at a time
+    render_section_items("top", content["top_developments"], week_folder)
 
     # Regional overviews
     st.markdown("---")
@@ -439,84 +3578,23 @@ def main():
         "This section provides a more granular analysis of the trends, challenges, and strategic movements shaping the aviation landscape in key geographic markets. "
         "It offers essential context beyond the global headlines, detailing the specific pressures and opportunities defining each region's trajectory."
     )
-    for idx, region in enumerate(content.get("regional_overviews", [])):
-        title = region.get("title", f"Region {idx + 1}")
-        desc = region.get("description", "")
-        # Two columns: left for region text, right for rating and feedback
-        article_col, interact_col = st.columns([4, 2])
-        with article_col:
-            url = region.get("url_source")
-            tags = region.get("tags", [])
-            bullet = f"- **{title}**"
-            if url:
-                bullet += f" [🔗]({url})"
-            if tags:
-                bullet += " " + " ".join([f"`{tag}`" for tag in tags])
-            st.markdown(bullet)
-            st.markdown(region.get("description", ""))
-        with interact_col:
-            # Initialize rating and submission state for this region if not present
-            rating_key = f"rating_region_{idx}"
-            submit_key = f"submitted_region_{idx}"
-            if rating_key not in st.session_state:
-                st.session_state[rating_key] = ""
-            if submit_key not in st.session_state:
-                st.session_state[submit_key] = False
-
-            current = st.session_state[rating_key]
-            up_label = "🟢👍" if current == "👍" else "👍"
-            down_label = "🔴👎" if current == "👎" else "👎"
-            up_col, down_col = st.columns(2)
-            with up_col:
-                if st.button(up_label, key=f"up_btn_region_{idx}"):
-                    st.session_state[rating_key] = "👍"
-                    st.rerun()
-            with down_col:
-                if st.button(down_label, key=f"down_btn_region_{idx}"):
-                    st.session_state[rating_key] = "👎"
-                    st.rerun()
-
-            rating = st.session_state[rating_key]
-            input_col, button_col = st.columns([4, 1])
-            with input_col:
-                user_feedback = st.text_input(
-                    label="", key=f"text_region_{idx}", placeholder="Your feedback..."
-                )
-            with button_col:
-                # Show green checkmark if already submitted, otherwise white checkbox
-                if st.session_state[submit_key]:
-                    st.markdown("✅", unsafe_allow_html=True)
-                else:
-                    if st.button("☑️", key=f"button_region_{idx}"):
-                        save_feedback(title, user_feedback, rating, week_folder)
-                        st.session_state.feedback[title] = user_feedback
-                        st.session_state[submit_key] = True
-                        st.rerun()
+    render_section_items("region", content["regional_overviews"], week_folder)
 
-    # Display collected feedback for the current edition
-    st.markdown("---")
-    st.markdown(f"## Feedback for {selected_label or 'Current Edition'}")
+    lap("items")
 
-    # Load feedback from the week's folder
-    feedback_df = load_feedback(week_folder)
-
-    if not feedback_df.empty:
-        # Display each feedback entry
-        for _, row in feedback_df.iterrows():
-            rating_icon = row['Rating'] if row['Rating'] else ""
-            st.markdown(f"**{row['Item']}** {rating_icon} ({row['Submitted At']}): {row['Comment']}")
-
-        # Provide a download button for feedback CSV
-        csv_data = feedback_df.to_csv(index=False)
-        st.download_button(
-            label="Download feedback as CSV",
-            data=csv_data,
-            file_name=f"feedback_{selected_label or 'current'}.csv",
-            mime="text/csv",
-        )
-    else:
-        st.info("No feedback submitted yet.")
+    # Display collected feedback for the current edition
+    item_titles = list(dict.fromkeys(
+        item["title"] for item in (*content["top_developments"], *content["regional_overviews"])
+    ))
+    render_feedback_section(week_folder, selected_label, item_titles)
+    lap("feedback")
+    return selected_label
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # `streamlit run app.py` serves the newsletter; `python app.py <command>`
+    # runs the maintenance commands
+    if st.runtime.exists():
+        main()
+    else:
+        sys.exit(cli())
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""
+Benchmark harness for the newsletter app.
+
+Generates a synthetic content tree (N editions with M items each, K feedback
+rows per edition and dummy audio files) for each profile, then times the hot
+paths of app.py: get_available_versions, load_render_artifact, load_content,
+search_editions, save_feedback, load_feedback, load_feedback_page,
+load_feedback_stats and a full main() render through Streamlit's AppTest.
+Benchmarks with a "_cold" suffix time the first call, which builds the on-disk
+artifacts, index or aggregates. Results are written as JSON so runs can be
+compared across revisions:
+
+    python benchmark.py                      # all profiles
+    python benchmark.py --profile small --output before.json
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+
+# name -> (editions, items per edition, feedback rows per edition, audio bytes)
+PROFILES = {
+    "small": (4, 10, 50, 64 * 1024),
+    "medium": (52, 30, 1000, 256 * 1024),
+    "five-years": (260, 30, 2000, 256 * 1024),
+}
+
+TAGS = [
+    "automation", "AI", "robotics", "sustainability", "electric GSE", "biogas",
+    "pooling", "safety", "regulation", "staffing", "Europe", "Asia", "Americas",
+    "Middle East", "Africa", "Guangzhou", "Vienna", "Shanghai", "Spain", "Dubai",
+]
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+
+def dummy_m4a(size: int, duration_seconds: int = 600) -> bytes:
+    """
+    Return a structurally valid MP4 container of roughly `size` bytes: an
+    `ftyp` box, a `moov` box with an `mvhd` header and a zero-filled `mdat`.
+    """
+    ftyp = _box(b"ftyp", b"M4A \x00\x00\x00\x00M4A mp42isom")
+    timescale = 1000
+    mvhd = _box(
+        b"mvhd",
+        struct.pack(">B3xIIII", 0, 0, 0, timescale, duration_seconds * timescale) + bytes(80),
+    )
+    moov = _box(b"moov", mvhd)
+    padding = max(0, size - len(ftyp) - len(moov) - 8)
+    return ftyp + moov + _box(b"mdat", bytes(padding))
+
+
+def _item(rng: random.Random, number: int) -> dict:
+    return {
+        "title": f"Development {number}: {rng.choice(TAGS)} update",
+        "description": " ".join(rng.choice(TAGS) for _ in range(40)) + f" [{number}].",
+        "url_source": f"[{number}]",
+        "tags": rng.sample(TAGS, 4),
+    }
+
+
+def generate_content(content_dir: str, editions: int, items: int, feedback_rows: int, audio_bytes: int, seed: int = 0):
+    """
+    Write `editions` weekly editions into `content_dir`, newest week last, each
+    with `items` items split between top developments and regional overviews,
+    `feedback_rows` feedback entries and an Executive Summary audio file.
+    """
+    rng = random.Random(seed)
+    audio = dummy_m4a(audio_bytes)
+    start_year = 2025 - (editions - 1) // 52
+    for index in range(editions):
+        year, week = start_year + index // 52, index % 52 + 1
+        folder = os.path.join(content_dir, f"Week {week} Y{year % 100:02d}")
+        os.makedirs(folder, exist_ok=True)
+        top = items - items // 3
+        edition = {
+            "title": f"Weekly Briefing {year} W{week}",
+            "subtitle": "Synthetic benchmark edition",
+            "period": "over the past week",
+            "week_number": week,
+            "year_number": year,
+            "audio_files": {},
+            "top_developments": [_item(rng, n) for n in range(top)],
+            "regional_overviews": [_item(rng, n) for n in range(top, items)],
+        }
+        with open(os.path.join(folder, f"Week {week} Y{year % 100:02d}.json"), "w", encoding="utf-8") as f:
+            json.dump(edition, f, indent=2)
+        with open(os.path.join(folder, "Executive Summary.m4a"), "wb") as f:
+            f.write(audio)
+        titles = [item["title"] for item in edition["top_developments"] + edition["regional_overviews"]]
+        with open(os.path.join(folder, "feedback.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["Item", "Rating", "Comment", "Submitted At"])
+            writer.writerows(
+                [
+                    rng.choice(titles), rng.choice(["👍", "👎", ""]),
+                    f"Synthetic comment {row}", f"{year}-01-01 00:00:{row % 60:02d}",
+                ]
+                for row in range(feedback_rows)
+            )
+
+
+def _stats(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _time(func, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return _stats(samples)
+
+
+def run_profile(name: str, repeat: int, workdir: str) -> dict:
+    """Generate the profile's content tree and time every benchmark on it."""
+    editions, items, feedback_rows, audio_bytes = PROFILES[name]
+    content_dir = os.path.join(workdir, name, "content_versions")
+    started = time.perf_counter()
+    generate_content(content_dir, editions, items, feedback_rows, audio_bytes)
+    generate_seconds = time.perf_counter() - started
+
+    # Point a fresh copy of the app module (and AppTest runs) at the synthetic tree
+    os.environ["NEWSLETTER_CONTENT_DIR"] = content_dir
+    import streamlit as st
+    st.cache_resource.clear()
+    import app
+    app = importlib.reload(app)
+
+    results = {}
+    results["get_available_versions_cold"] = _time(app.get_available_versions, 1)
+    results["get_available_versions"] = _time(app.get_available_versions, repeat)
+    versions = app.get_available_versions()
+    newest = versions[0]
+    week_folder = os.path.dirname(newest)
+
+    results["load_render_artifact_cold"] = _time(
+        lambda: [app.load_render_artifact(path) for path in versions], 1
+    )
+    results["load_render_artifact"] = _time(lambda: app.load_render_artifact(newest), repeat)
+    results["load_content_cold"] = _time(lambda: [app.load_content(path) for path in versions], 1)
+    results["load_content"] = _time(lambda: app.load_content(newest), repeat)
+    results["search_editions_cold"] = _time(lambda: app.search_editions("robotics"), 1)
+    results["search_editions"] = _time(lambda: app.search_editions("robotics"), repeat)
+    results["search_editions_prefix"] = _time(lambda: app.search_editions("sust"), repeat)
+    results["save_feedback"] = _time(
+        lambda: app.save_feedback("Benchmark item", "Benchmark comment", "👍", week_folder), repeat
+    )
+    results["load_feedback"] = _time(lambda: app.load_feedback(week_folder), repeat)
+    results["load_feedback_page"] = _time(lambda: app.load_feedback_page(week_folder, 0), repeat)
+    results["load_feedback_page_last"] = _time(
+        lambda: app.load_feedback_page(week_folder, feedback_rows // 20), repeat
+    )
+    results["load_feedback_stats_cold"] = _time(app.load_feedback_stats, 1)
+    results["load_feedback_stats"] = _time(app.load_feedback_stats, repeat)
+
+    from streamlit.testing.v1 import AppTest
+    apptest = AppTest.from_file(APP_PATH, default_timeout=600)
+    results["render_main_first"] = _time(apptest.run, 1)
+    if apptest.exception:
+        raise RuntimeError(f"main() raised: {apptest.exception}")
+    results["render_main_rerun"] = _time(apptest.run, repeat)
+
+    return {
+        "editions": editions,
+        "items_per_edition": items,
+        "feedback_rows_per_edition": feedback_rows,
+        "audio_bytes": audio_bytes,
+        "generate_seconds": generate_seconds,
+        "results": results,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--profile", action="append", choices=list(PROFILES),
+        help="profile to run (repeatable; default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per benchmark")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON results file")
+    parser.add_argument("--keep", action="store_true", help="keep the generated content trees")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, BASE_DIR)
+    workdir = tempfile.mkdtemp(prefix="newsletter-bench-")
+    report = {
+        "revision": _git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "profiles": {},
+    }
+    try:
+        for name in args.profile or list(PROFILES):
+            print(f"Running profile {name}...", file=sys.stderr)
+            report["profiles"][name] = profile = run_profile(name, args.repeat, workdir)
+            for bench, stats in profile["results"].items():
+                print(f"  {bench:30s} median {stats['median_ms']:9.2f} ms  p95 {stats['p95_ms']:9.2f} ms", file=sys.stderr)
+    finally:
+        if args.keep:
+            print(f"Content trees kept in {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
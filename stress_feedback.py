@@ -0,0 +1,291 @@
+"""
+Concurrent-session stress test for the feedback write path of app.py.
+
+Starts several processes, each running several threads that act as sessions
+submitting feedback to the same week folder, then reads the stored feedback
+back and checks that every submission arrived exactly once and intact.
+Reports throughput, per-submission latency percentiles and the number of
+lost, duplicated and corrupted rows. Exits with status 1 when any row was lost
+or corrupted, or a --min-throughput/--max-p99-ms threshold was missed, so it
+can run as a regression check after storage changes:
+
+    python stress_feedback.py                               # CSV, synchronous saves
+    python stress_feedback.py --backend sqlite --mode queued --processes 8
+    python stress_feedback.py --output stress.json --max-p99-ms 250
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WEEK_FOLDER_NAME = "Week 1"
+RATINGS = ["👍", "👎", ""]
+PRELOAD_ITEM = "Preloaded item"
+# Comments contain the characters most likely to break a CSV row
+_COMMENT = 'Session {session}, submission {number}: commas, "quotes",\na newline and ✈ unicode'
+_TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def _import_app(content_dir: str, backend: str, db_path: str):
+    """Import app.py configured for the stress test's content tree and backend."""
+    os.environ["NEWSLETTER_CONTENT_DIR"] = content_dir
+    os.environ["NEWSLETTER_FEEDBACK_BACKEND"] = backend
+    os.environ["NEWSLETTER_FEEDBACK_DB"] = db_path
+    sys.path.insert(0, BASE_DIR)
+    import app
+    # Streamlit warns about the missing script run context on every cached call
+    from streamlit import logger
+    logger.set_log_level("error")
+    return app
+
+
+def _expected_row(session: str, number: int) -> tuple[str, str, str]:
+    return (
+        f"Item {number % 10}",
+        RATINGS[number % len(RATINGS)],
+        _COMMENT.format(session=session, number=number),
+    )
+
+
+def _run_session(submit, week_folder: str, session: str, submissions: int, start: threading.Event, latencies: list):
+    start.wait()
+    for number in range(submissions):
+        item, rating, comment = _expected_row(session, number)
+        started = time.perf_counter()
+        submit(item, comment, rating, week_folder)
+        latencies.append(time.perf_counter() - started)
+
+
+def _run_process(index: int, args: argparse.Namespace, content_dir: str, db_path: str, ready, results):
+    """Run `args.threads` sessions in this process and report their latencies."""
+    try:
+        app = _import_app(content_dir, args.backend, db_path)
+        week_folder = os.path.join(content_dir, WEEK_FOLDER_NAME)
+        # With "queued", each process has one background writer, like one Streamlit server
+        writer = app.get_feedback_writer() if args.mode == "queued" else None
+        submit = app.submit_feedback if writer else app.save_feedback
+
+        start = threading.Event()
+        latencies: list[float] = []
+        threads = [
+            threading.Thread(
+                target=_run_session,
+                args=(submit, week_folder, f"{index}-{number}", args.submissions, start, latencies),
+            )
+            for number in range(args.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        ready.wait()
+        start.set()
+        for thread in threads:
+            thread.join()
+        if writer is not None:
+            writer.close()
+        results.put((index, latencies, writer.metrics() if writer else None, None))
+    except BaseException as e:
+        ready.abort()
+        results.put((index, [], None, repr(e)))
+
+
+def verify(app, week_folder: str, sessions: list[str], submissions: int) -> dict:
+    """
+    Compare the stored feedback with the submitted rows. Returns counts of
+    stored, lost, duplicated and corrupted rows; a corrupted row is one that
+    does not match any submission or has a malformed timestamp. Preloaded
+    rows are ignored.
+    """
+    expected = {
+        _expected_row(session, number)
+        for session in sessions
+        for number in range(submissions)
+    }
+    rows = app.get_feedback_store().load(week_folder)
+    stored = sum(row[0] != PRELOAD_ITEM for row in rows)
+    seen: set[tuple[str, str, str]] = set()
+    duplicated = corrupted = 0
+    for row in rows:
+        if row[0] == PRELOAD_ITEM:
+            continue
+        key = tuple(row[:3])
+        if key not in expected or not _TIMESTAMP_PATTERN.fullmatch(row[3]):
+            corrupted += 1
+        elif key in seen:
+            duplicated += 1
+        else:
+            seen.add(key)
+
+    # Rows the CSV reader had to drop (wrong field count) are corrupted too
+    feedback_path = app.get_feedback_path(week_folder)
+    if app.FEEDBACK_BACKEND == "csv" and os.path.isfile(feedback_path):
+        with open(feedback_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            malformed = sum(len(row) != len(app.FEEDBACK_COLUMNS) for row in csv.reader(f))
+        corrupted += malformed
+
+    return {
+        "submitted": len(expected),
+        "stored": stored,
+        "lost": len(expected - seen),
+        "duplicated": duplicated,
+        "corrupted": corrupted,
+    }
+
+
+def _percentiles(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def pick(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000
+
+    return {
+        "p50_ms": pick(0.50),
+        "p90_ms": pick(0.90),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def run(args: argparse.Namespace, workdir: str) -> dict:
+    """Run the stress test in `workdir` and return the report."""
+    content_dir = os.path.join(workdir, "content_versions")
+    week_folder = os.path.join(content_dir, WEEK_FOLDER_NAME)
+    db_path = os.path.join(workdir, "feedback.sqlite3")
+    os.makedirs(week_folder, exist_ok=True)
+
+    app = _import_app(content_dir, args.backend, db_path)
+    if args.preload:
+        # Existing feedback, so appends are measured against a non-empty store
+        app.get_feedback_store().append(week_folder, [
+            [PRELOAD_ITEM, "", f"Preloaded comment {number}", "2025-01-01 00:00:00"]
+            for number in range(args.preload)
+        ])
+
+    # Spawned processes import app.py from scratch, like separate servers
+    context = multiprocessing.get_context("spawn")
+    ready = context.Barrier(args.processes + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_run_process, args=(index, args, content_dir, db_path, ready, results))
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    errors = []
+    try:
+        ready.wait(timeout=120)
+    except threading.BrokenBarrierError:
+        errors.append("a worker process failed to start")
+    started = time.perf_counter()
+
+    latencies: list[float] = []
+    writer_metrics = []
+    for _ in processes:
+        index, process_latencies, metrics, error = results.get()
+        latencies.extend(process_latencies)
+        if metrics:
+            writer_metrics.append(metrics)
+        if error:
+            errors.append(f"process {index}: {error}")
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    sessions = [f"{index}-{number}" for index in range(args.processes) for number in range(args.threads)]
+    check = verify(app, week_folder, sessions, args.submissions)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "mode": args.mode,
+        "processes": args.processes,
+        "threads_per_process": args.threads,
+        "submissions_per_session": args.submissions,
+        "preload": args.preload,
+        "seconds": elapsed,
+        "throughput_rows_per_second": check["stored"] / elapsed if elapsed else 0.0,
+        "latency": _percentiles(latencies),
+        "writer_metrics": writer_metrics,
+        "errors": errors,
+        **check,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["csv", "sqlite"], default="csv", help="feedback storage backend")
+    parser.add_argument(
+        "--mode", choices=["sync", "queued"], default="sync",
+        help="save_feedback in each session, or submit_feedback through a per-process writer",
+    )
+    parser.add_argument("--processes", type=int, default=4, help="worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="sessions (threads) per process")
+    parser.add_argument("--submissions", type=int, default=100, help="submissions per session")
+    parser.add_argument("--preload", type=int, default=0, help="feedback rows stored before the test")
+    parser.add_argument("--min-throughput", type=float, default=0.0, help="fail below this many rows per second")
+    parser.add_argument("--max-p99-ms", type=float, default=0.0, help="fail above this p99 submission latency")
+    parser.add_argument("--output", help="also write the report to this JSON file")
+    parser.add_argument("--keep", action="store_true", help="keep the generated content tree")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="newsletter-stress-")
+    try:
+        report = run(args, workdir)
+    finally:
+        if args.keep:
+            print(f"Content tree kept in {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    latency = report["latency"]
+    print(
+        f"{report['backend']}/{report['mode']}: {report['processes']} processes x "
+        f"{report['threads_per_process']} sessions x {report['submissions_per_session']} submissions",
+        file=sys.stderr,
+    )
+    print(
+        f"  {report['stored']} of {report['submitted']} rows stored in {report['seconds']:.2f} s "
+        f"({report['throughput_rows_per_second']:.0f} rows/s)",
+        file=sys.stderr,
+    )
+    if latency:
+        print(
+            f"  latency p50 {latency['p50_ms']:.2f} ms  p90 {latency['p90_ms']:.2f} ms  "
+            f"p99 {latency['p99_ms']:.2f} ms  max {latency['max_ms']:.2f} ms",
+            file=sys.stderr,
+        )
+    print(
+        f"  lost {report['lost']}  duplicated {report['duplicated']}  corrupted {report['corrupted']}",
+        file=sys.stderr,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    failures = list(report["errors"])
+    if report["lost"] or report["duplicated"] or report["corrupted"]:
+        failures.append("feedback rows were lost, duplicated or corrupted")
+    if args.min_throughput and report["throughput_rows_per_second"] < args.min_throughput:
+        failures.append(f"throughput below {args.min_throughput:.0f} rows/s")
+    if args.max_p99_ms and latency.get("p99_ms", 0.0) > args.max_p99_ms:
+        failures.append(f"p99 latency above {args.max_p99_ms:.0f} ms")
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
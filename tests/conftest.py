@@ -0,0 +1,31 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def load_app(tmp_path, monkeypatch):
+    """
+    Return a function that reloads app.py pointed at a content tree in
+    `tmp_path` with the given feedback backend, like benchmark.py does.
+    """
+
+    def load(backend: str = "csv"):
+        monkeypatch.setenv("NEWSLETTER_CONTENT_DIR", str(tmp_path / "content_versions"))
+        monkeypatch.setenv("NEWSLETTER_FEEDBACK_BACKEND", backend)
+        monkeypatch.setenv("NEWSLETTER_FEEDBACK_DB", str(tmp_path / "feedback.sqlite3"))
+        monkeypatch.setenv("NEWSLETTER_WATCH", "0")
+        import streamlit as st
+        from streamlit import logger
+        # Cached calls outside a script run warn about the missing context
+        logger.set_log_level("error")
+        st.cache_resource.clear()
+        import app
+        return importlib.reload(app)
+
+    return load
@@ -0,0 +1,53 @@
+import struct
+
+import pytest
+
+import benchmark
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", len(payload) + 8, kind) + payload
+
+
+def _write(tmp_path, data: bytes) -> str:
+    path = tmp_path / "Executive Summary.m4a"
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_reads_version_0_movie_header(load_app, tmp_path):
+    app = load_app()
+    data = benchmark.dummy_m4a(100_000, duration_seconds=600)
+    metadata = app.read_mp4_metadata(_write(tmp_path, data))
+    assert metadata["size"] == len(data)
+    assert metadata["duration_seconds"] == 600
+    assert metadata["bitrate_kbps"] == round(len(data) * 8 / 600 / 1000, 1)
+
+
+def test_reads_version_1_header_and_64_bit_box_sizes(load_app, tmp_path):
+    app = load_app()
+    mvhd = _box(b"mvhd", struct.pack(">B3xQQIQ", 1, 0, 0, 44100, 44100 * 90) + bytes(80))
+    # An `mdat` with a 64-bit largesize header
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + 1000) + bytes(1000)
+    metadata = app.read_mp4_metadata(_write(tmp_path, _box(b"ftyp", b"M4A ") + mdat + _box(b"moov", mvhd)))
+    assert metadata["duration_seconds"] == 90
+
+
+def test_fragmented_file_falls_back_to_mehd(load_app, tmp_path):
+    app = load_app()
+    mvhd = _box(b"mvhd", struct.pack(">B3xIIII", 0, 0, 0, 1000, 0) + bytes(80))
+    mvex = _box(b"mvex", _box(b"mehd", struct.pack(">B3xI", 0, 45_000)))
+    metadata = app.read_mp4_metadata(_write(tmp_path, _box(b"moov", mvhd + mvex)))
+    assert metadata["duration_seconds"] == 45
+
+
+@pytest.mark.parametrize("data", [
+    b"ID3\x03\x00\x00\x00\x00\x00\x00 not an mp4 file",
+    _box(b"ftyp", b"M4A ") + _box(b"moov", _box(b"mvhd", bytes(100)))[:-10],
+    _box(b"ftyp", b"M4A ") + _box(b"mdat", bytes(100)),
+    b"\x00\x00",
+], ids=["mp3", "truncated moov", "no moov", "too short"])
+def test_rejects_invalid_containers(load_app, tmp_path, data):
+    app = load_app()
+    with pytest.raises(app.AudioMetadataError):
+        app.read_mp4_metadata(_write(tmp_path, data))
@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+
+def _write(path: str, edition: dict, mtime_ns: int | None = None) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(edition, f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def edition_path(tmp_path):
+    return str(tmp_path / "Week 1" / "Week 1 Y25.json")
+
+
+def test_entries_are_shared_until_the_file_changes(load_app, edition_path):
+    app = load_app()
+    cache = app.ContentCache()
+    _write(edition_path, {"title": "One"}, mtime_ns=10**18)
+    content = cache.get(edition_path)
+    assert cache.get(edition_path) is content
+    assert content["_base_dir"] == os.path.dirname(edition_path)
+
+    # Overwritten in place with the same size: only the mtime differs
+    _write(edition_path, {"title": "Two"}, mtime_ns=10**18 + 1)
+    assert cache.get(edition_path)["title"] == "Two"
+    # Same mtime, different size
+    _write(edition_path, {"title": "Three!"}, mtime_ns=10**18 + 1)
+    assert cache.get(edition_path)["title"] == "Three!"
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 1, "maxsize": app.CONTENT_CACHE_SIZE}
+
+
+def test_content_is_read_only(load_app, edition_path):
+    app = load_app()
+    _write(edition_path, {"title": "One", "top_developments": [{"tags": ["SAF"]}]})
+    content = app.ContentCache().get(edition_path)
+    with pytest.raises(TypeError):
+        content["title"] = "Changed"
+    with pytest.raises(TypeError):
+        content["top_developments"][0]["tags"] += ("more",)
+    assert content["top_developments"][0]["tags"] == ("SAF",)
+
+
+def test_least_recently_used_entries_are_evicted(load_app, tmp_path):
+    app = load_app()
+    cache = app.ContentCache(maxsize=2)
+    paths = [_write(str(tmp_path / f"Week {week}.json"), {"week_number": week}) for week in (1, 2, 3)]
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+    assert cache.stats()["size"] == 2
+    cache.get(paths[0])
+    cache.get(paths[1])
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 4)
+
+
+def test_invalidate_and_load_errors(load_app, edition_path):
+    app = load_app()
+    cache = app.ContentCache()
+    _write(edition_path, {"title": "One"})
+    loads = []
+    cache.get(edition_path, lambda path: loads.append(path) or {"title": "Built"})
+    cache.invalidate(edition_path)
+    assert cache.get(edition_path, lambda path: loads.append(path) or {"title": "Built"})["title"] == "Built"
+    assert len(loads) == 2
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+    with open(edition_path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    with pytest.raises(ValueError):
+        cache.get(edition_path)
+    os.remove(edition_path)
+    with pytest.raises(OSError):
+        cache.get(edition_path)
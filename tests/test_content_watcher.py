@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+
+class RecordingCache:
+    """Stands in for a content, artifact or audio cache and records invalidations."""
+
+    def __init__(self):
+        self.invalidated: list[str | None] = []
+
+    def invalidate(self, path=None):
+        self.invalidated.append(path)
+
+
+def _watcher(app, caches=None):
+    catalog = app.EditionCatalog(app.CONTENT_DIR, app.CATALOG_PATH)
+    content, artifacts, audio = caches or (app.ContentCache(), app.ContentCache(), app.AudioCache())
+    return app.ContentWatcher(app.CONTENT_DIR, catalog, content, artifacts, audio)
+
+
+def _write(path: str, edition: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(edition, f)
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "the watcher did not catch up"
+        time.sleep(0.02)
+
+
+def test_notify_drops_cached_content_and_ignores_generated_files(load_app):
+    app = load_app()
+    caches = RecordingCache(), RecordingCache(), RecordingCache()
+    watcher = _watcher(app, caches)
+    content, artifacts, audio = caches
+    folder = os.path.join(app.CONTENT_DIR, "Week 1")
+    edition = os.path.join(folder, "Week 1 Y25.json")
+
+    watcher.notify(edition, False)
+    assert content.invalidated == [edition]
+    assert artifacts.invalidated == [app.get_artifact_path(edition)]
+
+    watcher.notify(os.path.join(folder, "Executive Summary.m4a"), False)
+    assert audio.invalidated == [os.path.join(folder, "Executive Summary.m4a")]
+
+    for path in (
+        app.get_artifact_path(edition),
+        os.path.join(app.CONTENT_DIR, ".cache", "catalog.json"),
+        os.path.join(folder, "feedback.csv"),
+        os.path.join(os.path.dirname(app.CONTENT_DIR), "elsewhere.json"),
+    ):
+        watcher.notify(path, False)
+    assert (len(content.invalidated), len(artifacts.invalidated), len(audio.invalidated)) == (1, 1, 1)
+
+
+def test_catalog_follows_additions_overwrites_and_deletions(load_app, monkeypatch):
+    app = load_app()
+    monkeypatch.setattr(app, "WATCH_DEBOUNCE_SECONDS", 0.05)
+    first = os.path.join(app.CONTENT_DIR, "Week 1", "Week 1 Y25.json")
+    _write(first, {"title": "One"})
+    watcher = _watcher(app)
+    watcher.start()
+    try:
+        catalog = watcher.catalog
+
+        def titles():
+            return [entry["title"] for entry in catalog.editions()]
+
+        assert watcher.is_alive()
+        assert titles() == ["One"]
+
+        second = os.path.join(app.CONTENT_DIR, "Week 2", "Week 2 Y25.json")
+        _write(second, {"title": "Two"})
+        _wait_for(lambda: titles() == ["Two", "One"])
+
+        # The cached content of an overwritten edition is dropped with the event
+        assert watcher.content_cache.get(first)["title"] == "One"
+        _write(first, {"title": "One, corrected"})
+        _wait_for(lambda: titles() == ["Two", "One, corrected"])
+        assert watcher.content_cache.get(first)["title"] == "One, corrected"
+
+        # The folder also holds the edition's render artifact
+        shutil.rmtree(os.path.dirname(second))
+        _wait_for(lambda: titles() == ["One, corrected"])
+        # Events for generated files do not trigger refreshes
+        generation = catalog.generation
+        _write(app.get_artifact_path(first), {})
+        time.sleep(0.2)
+        assert catalog.generation == generation
+    finally:
+        watcher.stop()
+    assert not watcher.is_alive()
@@ -0,0 +1,115 @@
+import json
+import os
+
+
+def _write(content_dir, rel_path: str, edition: dict) -> str:
+    path = os.path.join(content_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(edition, f)
+    return path
+
+
+def _catalog(app):
+    catalog = app.EditionCatalog(app.CONTENT_DIR, app.CATALOG_PATH)
+    catalog.refresh()
+    return catalog
+
+
+def _order(catalog) -> list[str]:
+    return [os.path.relpath(entry["path"], catalog.content_dir) for entry in catalog.editions()]
+
+
+def test_editions_are_ordered_by_year_week_and_mtime(load_app):
+    app = load_app()
+    _write(app.CONTENT_DIR, "Week 52/Week 52 Y24.json", {"title": "Late 2024"})
+    _write(app.CONTENT_DIR, "Week 3/Week 3 Y25.json", {"title": "Early 2025"})
+    _write(app.CONTENT_DIR, "Week 10/Week 10.json", {"title": "No year", "week_number": 10})
+    _write(app.CONTENT_DIR, "Week 3 Y25/Week 3 Y25.json", {"title": "Same week"})
+    os.utime(os.path.join(app.CONTENT_DIR, "Week 3 Y25/Week 3 Y25.json"), (0, 0))
+
+    assert _order(_catalog(app)) == [
+        os.path.join("Week 3", "Week 3 Y25.json"),
+        os.path.join("Week 3 Y25", "Week 3 Y25.json"),
+        os.path.join("Week 52", "Week 52 Y24.json"),
+        # Editions without a year come last
+        os.path.join("Week 10", "Week 10.json"),
+    ]
+
+
+def test_week_and_year_are_derived_when_missing(load_app):
+    app = load_app()
+    paths = {
+        "explicit": _write(app.CONTENT_DIR, "a/Week 1 Y24.json", {"week_number": 7, "year_number": 2023}),
+        "names": _write(app.CONTENT_DIR, "Week 12/Edition Y25.json", {}),
+        "four digits": _write(app.CONTENT_DIR, "Week 5 Y2026/edition.json", {}),
+        "period": _write(
+            app.CONTENT_DIR, "Week 44/Week 44.json",
+            {"period": "24 October 2024 to 3 November 2025"},
+        ),
+        "unreadable": _write(app.CONTENT_DIR, "Week 9/broken.json", {}),
+    }
+    with open(paths["unreadable"], "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    entries = {entry["path"]: entry for entry in _catalog(app).editions()}
+    found = {name: (entries[path]["week_number"], entries[path]["year_number"]) for name, path in paths.items()}
+    assert found == {
+        "explicit": (7, 2023),
+        "names": (12, 2025),
+        "four digits": (5, 2026),
+        "period": (44, 2025),
+        "unreadable": (9, None),
+    }
+
+
+def test_refresh_notices_additions_overwrites_and_removals(load_app):
+    app = load_app()
+    first = _write(app.CONTENT_DIR, "Week 1/Week 1 Y25.json", {"title": "One"})
+    catalog = _catalog(app)
+    generation = catalog.generation
+    assert not catalog.refresh()
+
+    second = _write(app.CONTENT_DIR, "Week 2/Week 2 Y25.json", {"title": "Two"})
+    assert catalog.refresh()
+    assert [entry["path"] for entry in catalog.editions()] == [second, first]
+
+    # Overwriting a file in place leaves its directory's mtime unchanged
+    dir_mtime = os.stat(os.path.dirname(first)).st_mtime_ns
+    _write(app.CONTENT_DIR, "Week 1/Week 1 Y25.json", {"title": "One, corrected"})
+    os.utime(os.path.dirname(first), ns=(dir_mtime, dir_mtime))
+    assert catalog.refresh()
+    assert catalog.editions()[1]["title"] == "One, corrected"
+
+    os.remove(second)
+    assert catalog.refresh()
+    assert [entry["path"] for entry in catalog.editions()] == [first]
+    assert catalog.generation == generation + 3
+
+
+def test_manifest_is_reused_by_a_new_catalog(load_app, monkeypatch):
+    app = load_app()
+    _write(app.CONTENT_DIR, "Week 1/Week 1 Y25.json", {"title": "One"})
+    _catalog(app)
+
+    parsed = []
+    read_metadata = app._read_edition_metadata
+    monkeypatch.setattr(app, "_read_edition_metadata", lambda path: parsed.append(path) or read_metadata(path))
+    catalog = _catalog(app)
+    assert parsed == []
+    assert catalog.editions()[0]["title"] == "One"
+
+
+def test_changes_reports_new_changed_and_removed_editions(load_app):
+    app = load_app()
+    for week in (1, 2, 3):
+        _write(app.CONTENT_DIR, f"Week {week}/Week {week} Y25.json", {"title": str(week)})
+    catalog = _catalog(app)
+    entries, removed, changed = catalog.changes({})
+    assert removed == [] and sorted(changed) == sorted(entries)
+
+    known = {rel_path: {"mtime": entry["mtime"], "size": entry["size"]} for rel_path, entry in entries.items()}
+    week_2 = os.path.join("Week 2", "Week 2 Y25.json")
+    known[week_2]["size"] -= 1
+    known["Week 9/Week 9 Y25.json"] = {"mtime": 0, "size": 0}
+    assert catalog.changes(known)[1:] == (["Week 9/Week 9 Y25.json"], [week_2])
@@ -0,0 +1,91 @@
+import csv
+import gzip
+import io
+import os
+import zipfile
+
+import pytest
+
+
+def _rows(edition: int, count: int) -> list[list[str]]:
+    return [
+        [f"Item {n % 3}", ["👍", "👎", ""][n % 3], f'{edition}: "quoted", two\nlines {n}', f"2025-01-0{edition} 00:00:{n:02d}"]
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def editions(load_app, tmp_path, monkeypatch):
+    app = load_app("csv")
+    # Several chunks per edition
+    monkeypatch.setattr(app, "FEEDBACK_EXPORT_CHUNK_ROWS", 4)
+    week_folders = []
+    for edition, count in ((1, 10), (2, 0), (3, 5)):
+        week_folder = os.path.join(app.CONTENT_DIR, f"Week {edition}")
+        os.makedirs(week_folder)
+        if count:
+            app.CsvFeedbackStore().append(week_folder, _rows(edition, count))
+        week_folders.append(week_folder)
+    return app, week_folders
+
+
+def _expected(edition_column: bool = True) -> list[list[str]]:
+    return [
+        [f"Week {edition}", *row] if edition_column else row
+        for edition, count in ((1, 10), (3, 5))
+        for row in _rows(edition, count)
+    ]
+
+
+def _read_csv(data: bytes) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(data.decode("utf-8"), newline="")))
+
+
+def _export(app, week_folders, fmt, edition_column=True) -> bytes:
+    out = io.BytesIO()
+    app.export_feedback(week_folders, fmt, out, edition_column)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("edition_column", [True, False])
+def test_csv_round_trip(editions, edition_column):
+    app, week_folders = editions
+    header, *rows = _read_csv(_export(app, week_folders, "csv", edition_column))
+    assert header == (["Edition", *app.FEEDBACK_COLUMNS] if edition_column else app.FEEDBACK_COLUMNS)
+    assert rows == _expected(edition_column)
+
+
+def test_csv_gz_round_trip(editions):
+    app, week_folders = editions
+    header, *rows = _read_csv(gzip.decompress(_export(app, week_folders, "csv.gz")))
+    assert header == ["Edition", *app.FEEDBACK_COLUMNS]
+    assert rows == _expected()
+
+
+def test_zip_round_trip(editions):
+    app, week_folders = editions
+    with zipfile.ZipFile(io.BytesIO(_export(app, week_folders, "zip"))) as archive:
+        assert archive.namelist() == [f"Week {edition}/feedback.csv" for edition in (1, 2, 3)]
+        for edition, count in ((1, 10), (2, 0), (3, 5)):
+            header, *rows = _read_csv(archive.read(f"Week {edition}/feedback.csv"))
+            assert header == app.FEEDBACK_COLUMNS
+            assert rows == _rows(edition, count)
+
+
+def test_parquet_round_trip(editions):
+    pq = pytest.importorskip("pyarrow.parquet")
+    app, week_folders = editions
+    table = pq.read_table(io.BytesIO(_export(app, week_folders, "parquet")))
+    assert table.column_names == ["Edition", *app.FEEDBACK_COLUMNS]
+    assert [list(row.values()) for row in table.to_pylist()] == _expected()
+
+
+def test_download_matches_export(editions):
+    app, week_folders = editions
+    assert app.feedback_export_file(week_folders, "csv") == _export(app, week_folders, "csv")
+
+
+def test_unknown_format_is_rejected(editions):
+    app, week_folders = editions
+    with pytest.raises(ValueError, match="Unknown export format"):
+        _export(app, week_folders, "xlsx")
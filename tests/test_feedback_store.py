@@ -0,0 +1,192 @@
+import os
+
+import pytest
+
+COMMENTS = [
+    "plain",
+    "two\nlines",
+    'a "quoted", comma',
+    "blank\n\nline",
+    'ends with a quote"',
+    "",
+]
+
+
+@pytest.fixture
+def week_folder(tmp_path):
+    folder = tmp_path / "content_versions" / "Week 1"
+    folder.mkdir(parents=True)
+    return str(folder)
+
+
+def _rows(count: int) -> list[list[str]]:
+    return [
+        [f"Item {n % 4}", ["👍", "👎", ""][n % 3], f"{COMMENTS[n % len(COMMENTS)]} {n}", f"2025-01-01 00:00:{n % 60:02d}"]
+        for n in range(count)
+    ]
+
+
+def _feedback_bytes(app, week_folder) -> bytes:
+    with open(app.get_feedback_path(week_folder), "rb") as f:
+        return f.read()
+
+
+def test_backends_must_implement_the_abstract_methods(load_app, week_folder):
+    app = load_app("csv")
+
+    class AppendOnlyStore(app.FeedbackStore):
+        def append(self, week_folder, rows):
+            pass
+
+    with pytest.raises(TypeError, match="item_feedback, latest, load"):
+        AppendOnlyStore()
+
+    class ListStore(AppendOnlyStore):
+        def load(self, week_folder):
+            return _rows(5)
+
+        item_feedback = latest = load
+
+    # The other methods are built on load()
+    store = ListStore()
+    assert list(store.iter_chunks(week_folder, 2)) == [_rows(5)[:2], _rows(5)[2:4], _rows(5)[4:]]
+    assert store.read_since(week_folder, 3) == (_rows(5)[3:], 5, False)
+    assert store.page(week_folder, 0, 2) == (_rows(5)[::-1][:2], True)
+
+
+def test_csv_page_matches_load_with_multiline_comments(load_app, week_folder):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    store.append(week_folder, _rows(50))
+    rows = store.load(week_folder)
+    assert len(rows) == 50
+
+    for item in (None, "Item 1"):
+        for rating in (None, "👎"):
+            expected = [
+                row for row in reversed(rows)
+                if (item is None or row[0] == item) and (rating is None or row[1] == rating)
+            ]
+            for offset in (0, 4, len(expected) - 4, len(expected)):
+                page, has_more = store.page(week_folder, offset, 4, item, rating)
+                assert page == expected[offset:offset + 4]
+                assert has_more == (offset + 4 < len(expected))
+
+
+def test_csv_page_falls_back_when_reading_backwards_fails(load_app, week_folder):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    # A quote that was never opened leaves the reverse reader unbalanced
+    with open(app.get_feedback_path(week_folder), "wb") as f:
+        f.write(b'Item,Rating,Comment,Submitted At\nA,,bad"quote,2025\n')
+    store.append(week_folder, _rows(3))
+    assert store.page(week_folder, 0, 10) == app.FeedbackStore.page(store, week_folder, 0, 10)
+
+
+def test_csv_append_keeps_a_complete_row_without_newline(load_app, week_folder):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    with open(app.get_feedback_path(week_folder), "wb") as f:
+        f.write(b'Item,Rating,Comment,Submitted At\nA,\xf0\x9f\x91\x8d,"two\nlines",2025-01-01 00:00:00')
+    assert store.load(week_folder) == [["A", "👍", "two\nlines", "2025-01-01 00:00:00"]]
+    store.append(week_folder, [["B", "", "new", "2025-01-01 00:00:01"]])
+    assert [row[0] for row in store.load(week_folder)] == ["A", "B"]
+
+
+@pytest.mark.parametrize("tail", [b"T,,torn", b'T,,"torn\nacross lines', b"T,,torn,2025-01-0"])
+def test_csv_append_cuts_a_torn_row(load_app, week_folder, tail):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    store.append(week_folder, _rows(2))
+    with open(app.get_feedback_path(week_folder), "ab") as f:
+        f.write(tail)
+    assert store.load(week_folder) == _rows(2)
+    store.append(week_folder, [["B", "", "new", "2025-01-01 00:00:01"]])
+    assert store.load(week_folder) == _rows(2) + [["B", "", "new", "2025-01-01 00:00:01"]]
+    assert not _feedback_bytes(app, week_folder).count(b"torn")
+
+
+def test_csv_append_reads_one_byte_when_the_file_ends_with_a_newline(load_app, week_folder, monkeypatch):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    store.append(week_folder, _rows(2))
+
+    def fail(*args):
+        raise AssertionError("the tail was scanned")
+
+    monkeypatch.setattr(app, "_complete_size", fail)
+    store.append(week_folder, _rows(3)[2:])
+    assert store.load(week_folder) == _rows(3)
+
+
+def test_csv_read_since_follows_appends_and_resets(load_app, week_folder):
+    app = load_app("csv")
+    store = app.CsvFeedbackStore()
+    rows, cursor, reset = store.read_since(week_folder, 0)
+    assert (rows, reset) == ([], False)
+
+    store.append(week_folder, _rows(5))
+    rows, cursor, reset = store.read_since(week_folder, cursor)
+    assert (rows, reset) == (_rows(5), False)
+    assert store.read_since(week_folder, cursor) == ([], cursor, False)
+
+    # A torn tail is not returned, and the cursor does not move into it,
+    # until it is complete, even when it already spans several lines
+    for part in (b'C,,"half', b"\nway", b"\nthere"):
+        with open(app.get_feedback_path(week_folder), "ab") as f:
+            f.write(part)
+        assert store.read_since(week_folder, cursor) == ([], cursor, False)
+    with open(app.get_feedback_path(week_folder), "ab") as f:
+        f.write(b'",2025-01-01 00:00:00\n')
+    rows, cursor, reset = store.read_since(week_folder, cursor)
+    assert rows == [["C", "", "half\nway\nthere", "2025-01-01 00:00:00"]]
+    assert store.load(week_folder)[-1] == rows[0]
+
+    # A shorter file was replaced, so reading starts over
+    os.remove(app.get_feedback_path(week_folder))
+    store.append(week_folder, _rows(1))
+    rows, cursor, reset = store.read_since(week_folder, cursor)
+    assert (rows, reset) == (_rows(1), True)
+
+
+def test_sqlite_read_since_follows_appends_and_replacements(load_app, week_folder):
+    app = load_app("sqlite")
+    store = app.get_feedback_store()
+    edition = app.get_edition_key(week_folder)
+    store.append(week_folder, _rows(3))
+    rows, cursor, reset = store.read_since(week_folder, 0)
+    assert (rows, reset) == (_rows(3), False)
+    assert store.read_since(week_folder, cursor) == ([], cursor, False)
+
+    store.append(week_folder, _rows(4)[3:])
+    rows, cursor, reset = store.read_since(week_folder, cursor)
+    assert (rows, reset) == (_rows(4)[3:], False)
+
+    store.replace_edition(edition, _rows(2))
+    rows, cursor, reset = store.read_since(week_folder, cursor)
+    assert (rows, reset) == (_rows(2), True)
+    assert store.read_since(week_folder, cursor) == ([], cursor, False)
+
+
+def test_aggregates_count_replaced_feedback_once(load_app, week_folder):
+    app = load_app("sqlite")
+    # With a second edition, re-imported rows cannot reuse the old row ids
+    week_folders = [week_folder, os.path.join(os.path.dirname(week_folder), "Week 2")]
+    os.makedirs(week_folders[1])
+    for folder in week_folders:
+        app.CsvFeedbackStore().append(folder, _rows(3))
+    assert app.migrate_feedback() == {"Week 1": 3, "Week 2": 3}
+
+    aggregates = app.get_feedback_aggregates()
+
+    def totals() -> dict[str, int]:
+        return {
+            edition: sum(sum(ratings.values()) for ratings in state["items"].values())
+            for edition, state in aggregates.snapshot().items()
+        }
+
+    aggregates.sync(week_folders)
+    assert totals() == {"Week 1": 3, "Week 2": 3}
+    assert app.migrate_feedback(replace=True) == {"Week 1": 3, "Week 2": 3}
+    aggregates.sync(week_folders)
+    assert totals() == {"Week 1": 3, "Week 2": 3}
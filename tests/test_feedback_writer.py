@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+
+class RecordingStore:
+    """
+    Feedback store that records appends and fails the first `failures` of
+    them. Appends from the writer thread wait until `release` is set.
+    """
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.appends: list[tuple[str, list[list[str]]]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def append(self, week_folder, rows):
+        if threading.current_thread().name == "feedback-writer":
+            self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            raise OSError("volume unavailable")
+        self.appends.append((week_folder, rows))
+
+    def rows(self, week_folder=None) -> list[list[str]]:
+        return [row for folder, rows in self.appends if week_folder in (None, folder) for row in rows]
+
+
+def _row(number: int) -> list[str]:
+    return [f"Item {number}", "👍", f"Comment {number}", "2025-01-01 00:00:00"]
+
+
+def test_rows_are_batched_per_edition(load_app):
+    app = load_app()
+    store = RecordingStore()
+    store.release.clear()
+    writer = app.FeedbackWriter(store, batch_size=100, flush_interval=0.2)
+    for number in range(250):
+        assert writer.submit(f"Week {number % 2}", _row(number))
+    store.release.set()
+    assert writer.flush()
+    writer.close()
+
+    assert store.rows("Week 0") == [_row(n) for n in range(0, 250, 2)]
+    assert store.rows("Week 1") == [_row(n) for n in range(1, 250, 2)]
+    # One append per edition and batch, each batch at most batch_size rows
+    assert sum(len(rows) for _, rows in store.appends) == 250
+    assert len(store.appends) <= 2 * 4
+    metrics = writer.metrics()
+    assert (metrics["submitted"], metrics["written"], metrics["failed"]) == (250, 250, 0)
+
+
+def test_a_partial_batch_is_written_after_the_flush_interval(load_app):
+    app = load_app()
+    store = RecordingStore()
+    writer = app.FeedbackWriter(store, batch_size=100, flush_interval=0.05)
+    writer.submit("Week 1", _row(1))
+    assert writer.flush(timeout=2.0)
+    assert store.rows() == [_row(1)]
+    writer.close()
+
+
+def test_failed_writes_are_retried(load_app):
+    app = load_app()
+    store = RecordingStore(failures=2)
+    writer = app.FeedbackWriter(store, flush_interval=0.01, retry_interval=0.01)
+    writer.submit("Week 1", _row(1))
+    assert writer.flush(timeout=2.0)
+    writer.submit("Week 1", _row(2))
+    assert writer.flush(timeout=2.0)
+    writer.close()
+    assert store.rows() == [_row(1), _row(2)]
+    metrics = writer.metrics()
+    assert (metrics["written"], metrics["retried"], metrics["failed"]) == (2, 2, 0)
+
+
+def test_close_writes_pending_rows_and_later_rows_synchronously(load_app):
+    app = load_app()
+    store = RecordingStore()
+    writer = app.FeedbackWriter(store, flush_interval=5.0)
+    assert writer.submit("Week 1", _row(1))
+    writer.close()
+    assert store.rows() == [_row(1)]
+
+    assert writer.submit("Week 1", _row(2)) is False
+    assert store.rows() == [_row(1), _row(2)]
+    # Synchronous writes raise, as save_feedback does
+    store.failures = 1
+    with pytest.raises(OSError):
+        writer.submit("Week 1", _row(3))
+    metrics = writer.metrics()
+    assert (metrics["written"], metrics["written_synchronously"], metrics["failed"]) == (2, 1, 1)
+
+
+def test_a_full_queue_is_written_synchronously(load_app, monkeypatch):
+    app = load_app()
+    monkeypatch.setattr(app, "FEEDBACK_QUEUE_TIMEOUT", 0.01)
+    store = RecordingStore()
+    store.release.clear()
+    writer = app.FeedbackWriter(store, maxsize=1, batch_size=1, flush_interval=0.0)
+    assert writer.submit("Week 1", _row(1))
+    while writer.metrics()["queue_depth"]:
+        time.sleep(0.001)
+    # The writer is blocked on the first row, so the second fills the queue
+    # and the third times out on it and is written synchronously
+    assert writer.submit("Week 1", _row(2))
+    assert writer.submit("Week 1", _row(3)) is False
+    assert store.rows() == [_row(3)]
+    store.release.set()
+    assert writer.flush()
+    writer.close()
+    assert sorted(store.rows()) == [_row(1), _row(2), _row(3)]
+    assert writer.metrics()["written_synchronously"] == 1
@@ -0,0 +1,103 @@
+import json
+import os
+
+
+def _write_edition(content_dir, week: int, edition: dict) -> str:
+    folder = os.path.join(content_dir, f"Week {week}")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"Week {week} Y25.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(edition, f)
+    return path
+
+
+def _edition(week: int) -> dict:
+    return {
+        "title": f"Week {week}",
+        "week_number": week,
+        "year_number": 2025,
+        "top_developments": [{"title": "Fuel", "description": "SAF mandate.", "url_source": "", "tags": ["SAF"]}],
+    }
+
+
+def test_build_command_builds_new_editions_in_the_pool(load_app, capsys):
+    app = load_app()
+    for week in (1, 2):
+        _write_edition(app.CONTENT_DIR, week, _edition(week))
+    _write_edition(app.CONTENT_DIR, 3, {"title": 3, "top_developments": [{"tags": "SAF"}]})
+
+    assert app.cli(["build", "--workers", "2"]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(lines[:-1]) == [
+        os.path.join("Week 1", "Week 1 Y25.json") + ": built",
+        os.path.join("Week 2", "Week 2 Y25.json") + ": built",
+        os.path.join("Week 3", "Week 3 Y25.json") + ": failed: Week 3 Y25.json: "
+        "'title' must be a string; top_developments[0].tags must be a list of strings",
+    ]
+    assert lines[-1] == "2 editions up to date, 1 failed."
+
+    # Unchanged editions are skipped, changed ones rebuilt
+    _write_edition(app.CONTENT_DIR, 3, _edition(3))
+    assert app.cli(["build", "--workers", "2"]) == 0
+    results = dict(line.rsplit(": ", 1) for line in capsys.readouterr().out.splitlines()[:-1])
+    assert sorted(results.values()) == ["built", "skipped", "skipped"]
+
+
+def _count_compiles(app, monkeypatch) -> list[str]:
+    calls = []
+    compile_edition = app.compile_edition
+
+    def counting(json_path):
+        calls.append(json_path)
+        return compile_edition(json_path)
+
+    monkeypatch.setattr(app, "compile_edition", counting)
+    return calls
+
+
+def test_artifacts_are_compiled_once_per_change(load_app, monkeypatch):
+    app = load_app()
+    path = _write_edition(app.CONTENT_DIR, 1, _edition(1))
+    calls = _count_compiles(app, monkeypatch)
+    for _ in range(3):
+        artifact = app.load_render_artifact(path)
+        assert artifact["top_developments"][0]["bullet"] == "- **Fuel** `SAF`"
+    assert len(calls) == 1
+    assert os.path.isfile(app.get_artifact_path(path))
+
+    _write_edition(app.CONTENT_DIR, 1, {**_edition(1), "title": "Changed"})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert app.load_render_artifact(path)["title"] == "Changed"
+    assert len(calls) == 2
+
+
+def test_artifacts_stay_in_memory_on_a_read_only_volume(load_app, monkeypatch):
+    app = load_app()
+    path = _write_edition(app.CONTENT_DIR, 1, _edition(1))
+    calls = _count_compiles(app, monkeypatch)
+
+    def read_only(path, data, **dump_kwargs):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(app, "_write_json_atomic", read_only)
+    for _ in range(3):
+        artifact = app.load_render_artifact(path)
+        assert artifact["_base_dir"] == os.path.dirname(path)
+        assert artifact["top_developments"][0]["title"] == "Fuel"
+    assert len(calls) == 1
+    assert not os.path.exists(app.get_artifact_path(path))
+
+    _write_edition(app.CONTENT_DIR, 1, {**_edition(1), "title": "Changed"})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert app.load_render_artifact(path)["title"] == "Changed"
+    assert len(calls) == 2
+
+
+def test_invalid_editions_are_reported_not_rendered(load_app, monkeypatch):
+    app = load_app()
+    path = _write_edition(app.CONTENT_DIR, 1, {"top_developments": "none", "week_number": "1"})
+    warnings = []
+    monkeypatch.setattr(app.st, "warning", warnings.append)
+    assert app.load_render_artifact(path) is None
+    assert "'week_number' must be an integer" in warnings[0]
+    assert "'top_developments' must be a list" in warnings[0]
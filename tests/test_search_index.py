@@ -0,0 +1,85 @@
+import json
+import os
+
+
+def _write_edition(content_dir, week: int, items: list[dict]):
+    folder = os.path.join(content_dir, f"Week {week}")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"Week {week} Y25.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"title": f"Week {week}", "week_number": week, "year_number": 2025, "top_developments": items}, f)
+    return path
+
+
+def _item(title: str, description: str = "", tags: list[str] | None = None) -> dict:
+    return {"title": title, "description": description, "url_source": "", "tags": tags or []}
+
+
+def _titles(results: list[dict]) -> list[str]:
+    return [result["title"] for result in results]
+
+
+def test_search_ranks_matches_and_follows_edits(load_app):
+    app = load_app()
+    path = _write_edition(app.CONTENT_DIR, 1, [
+        _item("Airport expansion", "Runway works at the hub."),
+        _item("Fuel prices", "Airport charges rise.", ["Airports"]),
+        _item("Rail strike", "Trains cancelled."),
+    ])
+    _write_edition(app.CONTENT_DIR, 2, [_item("Sustainable fuel mandate", "Airport levy planned.")])
+    catalog = app.get_edition_catalog()
+    catalog.refresh()
+    index = app.SearchIndex(app.SEARCH_INDEX_DIR)
+    index.sync(catalog)
+
+    # Title matches outrank tag and description matches
+    assert _titles(index.search("airport")) == ["Airport expansion", "Fuel prices", "Sustainable fuel mandate"]
+    # Every term must match; the last one also as a prefix
+    assert _titles(index.search("fuel air")) == ["Fuel prices", "Sustainable fuel mandate"]
+    assert index.search("trains planes") == []
+    assert index.search("") == []
+
+    # The index persists and a new instance reads it back
+    reloaded = app.SearchIndex(index.index_dir)
+    assert _titles(reloaded.search("rail")) == ["Rail strike"]
+
+    # Overwriting an edition in place is picked up without a watcher, and only
+    # its own segment is rewritten
+    segments = {name: os.stat(os.path.join(index.index_dir, name)).st_mtime_ns for name in os.listdir(index.index_dir)}
+    assert len(segments) == 2
+    _write_edition(app.CONTENT_DIR, 1, [_item("Bus lanes", "Road works.")])
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    catalog.refresh()
+    index.sync(catalog)
+    assert index.search("rail") == []
+    assert _titles(index.search("bus")) == ["Bus lanes"]
+    rewritten = [
+        name for name, mtime_ns in segments.items()
+        if os.stat(os.path.join(index.index_dir, name)).st_mtime_ns != mtime_ns
+    ]
+    assert rewritten == [os.path.basename(index._segment_path(os.path.relpath(path, app.CONTENT_DIR)))]
+    assert _titles(app.SearchIndex(index.index_dir).search("bus")) == ["Bus lanes"]
+
+    os.remove(path)
+    catalog.refresh()
+    index.sync(catalog)
+    assert index.search("bus") == []
+    assert _titles(index.search("airport")) == ["Sustainable fuel mandate"]
+    assert len(os.listdir(index.index_dir)) == 1
+
+
+def test_short_prefixes_expand_to_a_bounded_number_of_tokens(load_app):
+    app = load_app()
+    count = app.SEARCH_PREFIX_EXPANSIONS + 10
+    _write_edition(app.CONTENT_DIR, 1, [_item(f"Route w{n:03d}") for n in range(count)] + [_item("W")])
+    catalog = app.get_edition_catalog()
+    catalog.refresh()
+    index = app.SearchIndex(app.SEARCH_INDEX_DIR)
+    index.sync(catalog)
+
+    # One character only matches the exact token
+    assert _titles(index.search("w")) == ["W"]
+    # Longer prefixes expand to the first SEARCH_PREFIX_EXPANSIONS tokens
+    results = index.search("w0", limit=count)
+    assert len(results) == app.SEARCH_PREFIX_EXPANSIONS
+    assert _titles(index.search("w04")) == [f"Route w{n:03d}" for n in range(40, count)]
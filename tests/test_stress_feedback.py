@@ -0,0 +1,19 @@
+import argparse
+
+import pytest
+
+import stress_feedback
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"])
+@pytest.mark.parametrize("mode", ["sync", "queued"])
+def test_concurrent_submissions_are_stored_once(load_app, tmp_path, backend, mode):
+    load_app(backend)
+    args = argparse.Namespace(
+        backend=backend, mode=mode, processes=2, threads=2, submissions=10, preload=5,
+        min_throughput=0.0, max_p99_ms=0.0, output=None, keep=False,
+    )
+    report = stress_feedback.run(args, str(tmp_path))
+    assert report["errors"] == []
+    assert report["stored"] == report["submitted"] == 40
+    assert report["lost"] == report["duplicated"] == report["corrupted"] == 0
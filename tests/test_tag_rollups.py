@@ -0,0 +1,90 @@
+import json
+import os
+
+
+def _write_edition(content_dir, year: int, week: int, tags: list[list[str]]) -> str:
+    folder = os.path.join(content_dir, f"Week {week} Y{year % 100}")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"Week {week} Y{year % 100}.json")
+    edition = {
+        "title": f"Week {week}",
+        "week_number": week,
+        "year_number": year,
+        "top_developments": [
+            {"title": f"Item {n}", "description": "", "url_source": "", "tags": item_tags}
+            for n, item_tags in enumerate(tags)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(edition, f)
+    return path
+
+
+def _rollups(app):
+    catalog = app.EditionCatalog(app.CONTENT_DIR, app.CATALOG_PATH)
+    catalog.refresh()
+    rollups = app.TagRollups(app.TAG_ROLLUPS_PATH)
+    rollups.sync(catalog)
+    return catalog, rollups
+
+
+def test_weekly_and_yearly_tables(load_app):
+    app = load_app()
+    _write_edition(app.CONTENT_DIR, 2024, 52, [["SAF", "Europe"], ["SAF"]])
+    _write_edition(app.CONTENT_DIR, 2025, 1, [["AI"], ["SAF", "AI"]])
+    _write_edition(app.CONTENT_DIR, 2025, 2, [["Europe"]])
+    tables = _rollups(app)[1].tables()
+
+    weekly = tables["weekly"]
+    assert list(weekly.index) == [(2024, 52), (2025, 1), (2025, 2)]
+    assert weekly.loc[(2024, 52)].to_dict() == {"AI": 0, "Europe": 1, "SAF": 2}
+    assert weekly.loc[(2025, 1)].to_dict() == {"AI": 2, "Europe": 0, "SAF": 1}
+    assert tables["yearly"].loc[2025].to_dict() == {"AI": 2, "Europe": 1, "SAF": 1}
+
+
+def test_sync_recounts_only_changed_editions(load_app, monkeypatch):
+    app = load_app()
+    first = _write_edition(app.CONTENT_DIR, 2025, 1, [["SAF"]])
+    second = _write_edition(app.CONTENT_DIR, 2025, 2, [["AI"]])
+    catalog, rollups = _rollups(app)
+    assert rollups.tables()["weekly"].loc[(2025, 2)].to_dict() == {"AI": 1, "SAF": 0}
+
+    compiled = []
+    compile_edition = app.compile_edition
+    monkeypatch.setattr(app, "compile_edition", lambda path: compiled.append(path) or compile_edition(path))
+    # Unchanged catalog: nothing to do
+    rollups.sync(catalog)
+    assert compiled == []
+
+    _write_edition(app.CONTENT_DIR, 2025, 2, [["AI"], ["AI", "Europe"]])
+    os.utime(second, ns=(0, os.stat(second).st_mtime_ns + 1_000_000))
+    os.remove(first)
+    catalog.refresh()
+    rollups.sync(catalog)
+    assert compiled == [second]
+    assert rollups.tables()["weekly"].to_dict("index") == {(2025, 2): {"AI": 2, "Europe": 1}}
+
+    # A new instance picks the counts up from the saved rollups
+    reloaded = app.TagRollups(app.TAG_ROLLUPS_PATH)
+    reloaded.sync(catalog)
+    assert compiled == [second]
+    assert reloaded.tables()["weekly"].equals(rollups.tables()["weekly"])
+
+
+def test_tag_trends_compare_recent_and_previous_windows(load_app):
+    import pandas as pd
+
+    app = load_app()
+    weekly = pd.DataFrame(
+        {"SAF": [4, 4, 0, 0], "AI": [0, 0, 2, 4], "Europe": [1, 1, 1, 1]},
+        index=pd.MultiIndex.from_tuples([(2025, week) for week in range(1, 5)], names=["year", "week"]),
+    )
+    trends = app.tag_trends(weekly, window=2)
+    assert list(trends.index) == ["AI", "Europe", "SAF"]
+    assert trends.loc["AI"].to_dict() == {"recent": 3.0, "previous": 0.0, "change": 3.0}
+    assert trends.loc["SAF"].to_dict() == {"recent": 0.0, "previous": 4.0, "change": -4.0}
+
+    # Without a previous window, every tag counts as new
+    trends = app.tag_trends(weekly.tail(2), window=4)
+    assert trends["previous"].eq(0).all()
+    assert trends.loc["AI", "change"] == 3.0